@@ -71,13 +71,17 @@ def main():
             print('not cleaning up %s' % workdir)
     atexit.register(cleanup_workdir)
 
+    # The workdir is reused for every file, so each repository only
+    # needs to be cloned once.
+    cloned_repos = set()
+
     for filename in filenames:
         print('\nChecking %s' % filename)
         if not os.path.isfile(filename):
             print("File was deleted, skipping.")
             continue
         with open(filename, 'r') as f:
-            deliverable_info = yamlutils.loads(f.read())
+            deliverable_info = yamlutils.safe_load(f)
 
         branch = 'stable/' + args.prev_series
 
@@ -97,7 +101,9 @@ def main():
             print('  diff-start: {!r}'.format(diff_start))
 
         for project in new_release['projects']:
-            gitutils.clone_repo(workdir, project['repo'])
+            if project['repo'] not in cloned_repos:
+                gitutils.clone_repo(workdir, project['repo'])
+                cloned_repos.add(project['repo'])
 
             branch_base = gitutils.get_branch_base(
                 workdir, project['repo'], branch,
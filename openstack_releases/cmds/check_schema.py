@@ -30,16 +30,16 @@ from openstack_releases import yamlutils
 
 LOG = logging.getLogger('')
 
-_SERIES_SCHEMA = yamlutils.loads(
+_SERIES_SCHEMA = yamlutils.safe_load(
     pkgutil.get_data('openstack_releases',
                      'series_status_schema.yaml').decode('utf-8')
 )
 
-_DELIVERABLE_SCHEMA = yamlutils.loads(
+_DELIVERABLE_SCHEMA = yamlutils.safe_load(
     pkgutil.get_data('openstack_releases', 'schema.yaml').decode('utf-8')
 )
 
-_LIAISONS_SCHEMA = yamlutils.loads(
+_LIAISONS_SCHEMA = yamlutils.safe_load(
     pkgutil.get_data('openstack_releases',
                      'liaisons_schema.yaml').decode('utf-8')
 )
@@ -65,7 +65,7 @@ def validate_one_file(filename, schema_data, debug):
     LOG.info('Checking %s', filename)
     validator = make_validator_with_date(schema_data)
     with open(filename, 'r', encoding='utf-8') as f:
-        info = yamlutils.loads(f.read())
+        info = yamlutils.safe_load(f)
     for error in validator.iter_errors(info):
         LOG.error(error)
         yield '{}: {}'.format(filename, error)
@@ -126,19 +126,19 @@ def main():
     # Some deliverables were independent at one time but might not be
     # any more, so compare the independent list with the current
     # release series.
+    all_deliv = deliverable.Deliverables(
+        root_dir=args.deliverables_dir,
+        collapse_history=True,
+    )
     all_independent_deliverables = set(
         name
-        for team, series, name, deliv in deliverable.Deliverables(
-            root_dir=args.deliverables_dir,
-            collapse_history=True,
-        ).get_deliverables(None, None)
+        for team, series, name, deliv in all_deliv.get_deliverables(
+            None, None)
     )
     current_deliverables = set(
         name
-        for team, series, name, deliv in deliverable.Deliverables(
-            root_dir=args.deliverables_dir,
-            collapse_history=True,
-        ).get_deliverables(None, defaults.RELEASE)
+        for team, series, name, deliv in all_deliv.get_deliverables(
+            None, defaults.RELEASE)
     )
     independent_deliverables = all_independent_deliverables.difference(
         current_deliverables)
@@ -63,9 +63,13 @@ def main():
     for deliv in old_deliverables:
         if deliv.name in new_deliverables:
             continue
+        # Read the file again with the round-trip loader, so the copy
+        # keeps its comments and formatting.
+        infilename = os.path.join(args.deliverables_dir, deliv.filename)
+        with open(infilename, 'r', encoding='utf-8') as f:
+            raw_data = yamlutils.loads(f.read())
         # Clean up some series-specific data that should not be copied
         # over.
-        raw_data = deliv.data
         for key in IGNORE:
             if key in raw_data:
                 del raw_data[key]
@@ -357,7 +357,7 @@ def main():
                 deliverable_info = None
             else:
                 with open(last_release_path, 'rb') as fh:
-                    deliverable_info = yamlutils.loads(fh.read())
+                    deliverable_info = yamlutils.safe_load(fh.read())
                 try:
                     last_release = deliverable_info['releases'][-1]
                 except (IndexError, KeyError, TypeError):
@@ -175,7 +175,7 @@ def list_gerrit_patches(title, template, query):
 
 def show_watched_queries(branch, repo):
     with open('watched_queries.yml', 'r', encoding='utf-8') as f:
-        watched_queries = yamlutils.loads(f.read())
+        watched_queries = yamlutils.safe_load(f.read())
     template = watched_queries['template']
     for q in watched_queries['queries']:
         list_gerrit_patches(
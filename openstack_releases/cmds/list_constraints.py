@@ -39,7 +39,7 @@ def main():
     missing = []
     for filename in filenames:
         with open(filename, 'r', encoding='utf-8') as f:
-            deliverable_info = yamlutils.loads(f.read())
+            deliverable_info = yamlutils.safe_load(f)
 
         deliverable_name = os.path.splitext(os.path.basename(filename))[0]
 
@@ -42,7 +42,7 @@ def main():
     ))
 
     with open(schedule_filename, 'r') as f:
-        schedule_data = yamlutils.loads(f.read())
+        schedule_data = yamlutils.safe_load(f.read())
 
     print('Release Team Calendar for {}\n'.format(series.title()))
 
@@ -185,7 +185,11 @@ def main():
             workdir, projects[0].repo.name, branch,
         )
 
-        deliverable_data = deliv.data
+        # Read the file again with the round-trip loader, so the
+        # rewritten file keeps its comments and formatting.
+        filename = os.path.join(deliverables_dir, deliv.filename)
+        with open(filename, 'r', encoding='utf-8') as f:
+            deliverable_data = yamlutils.loads(f.read())
         release_data = {
             'version': new_version,
             'projects': deliv.data['releases'][-1]['projects'],
@@ -196,6 +200,5 @@ def main():
         print('new version for {}: {}'.format(
             deliv.name, new_version))
 
-        filename = os.path.join(deliverables_dir, deliv.filename)
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(yamlutils.dumps(deliverable_data))
@@ -17,16 +17,21 @@
 import argparse
 import atexit
 import collections
+import concurrent.futures
+import contextlib
 import functools
 import glob
 import inspect
+import io
 import logging
 import os
 import os.path
-import re
 import shutil
+import string
 import sys
 import tempfile
+import threading
+import weakref
 
 from openstack_governance import governance
 import requests
@@ -76,11 +81,19 @@ _USES_PREVER = set([
     'cycle-with-rc',
 ])
 
-_VALID_BRANCH_PREFIXES = set([
+_VALID_BRANCH_PREFIXES = frozenset([
     'stable',
     'feature',
     'bugfix',
 ])
+# The prefixes in a stable order, for error messages.
+_VALID_BRANCH_PREFIX_LIST = ', '.join(sorted(_VALID_BRANCH_PREFIXES))
+
+# Release models that must be used by deliverables in _independent.
+_INDEPENDENT_MODELS = frozenset([
+    'independent',
+    'abandoned',
+])
 
 _NO_STABLE_BRANCH_CHECK = set([
     'gnocchi',
@@ -97,6 +110,37 @@ _TYPE_TO_RELEASE_TYPE = {
 
 _PYTHON_RELEASE_TYPES = ['python-service', 'python-pypi', 'neutron', 'horizon']
 
+# Cloning is bound by network latency, not CPU, so allow more
+# concurrent clones than there are cores.
+_MAX_CLONE_WORKERS = 16
+
+# The projects in one release are few, and each worker mostly waits on
+# git subprocesses.
+_MAX_PROJECT_WORKERS = 8
+
+_LAUNCHPAD_API = 'https://api.launchpad.net/1.0/'
+
+_STORYBOARD_API = 'https://storyboard.openstack.org/api/v1/projects'
+
+# Launchpad lookups are cheap for the server, so use enough workers to
+# keep the pooled connections busy.
+_MAX_LAUNCHPAD_WORKERS = 16
+
+# Deliverables with many repositories may link to a release notes page
+# for each of them.
+_MAX_LINK_WORKERS = 8
+
+# Seconds to wait for a response from the bug trackers and other sites.
+_HTTP_TIMEOUT = 10
+
+# Share one session, and so the kept-alive connections, between all of
+# the queries made while validating.
+_SESSION = requests.Session()
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_maxsize=_MAX_LAUNCHPAD_WORKERS,
+    max_retries=urllib3.util.retry.Retry(total=3, backoff_factor=0.2),
+))
+
 _PLEASE = ('It is too expensive to determine this value during '
            'the site build, please set it explicitly.')
 
@@ -108,7 +152,55 @@ def header(title, underline='-'):
 
 def is_a_hash(val):
     "Return bool indicating if val looks like a valid hash."
-    return re.search('^[a-f0-9]{40}$', val, re.I) is not None
+    # Stripping every hex digit leaves nothing behind for a valid hash.
+    # YAML turns some unquoted locations into numbers, which are never
+    # hashes.
+    return (isinstance(val, six.string_types) and len(val) == 40 and
+            not val.strip(string.hexdigits))
+
+
+class _MessageBuffer(object):
+    "Hold warnings and errors from a worker thread to report in order."
+
+    def __init__(self):
+        self._messages = []
+
+    def warning(self, msg):
+        self._messages.append((True, msg))
+
+    def error(self, msg):
+        self._messages.append((False, msg))
+
+    def report(self, context):
+        for is_warning, msg in self._messages:
+            if is_warning:
+                context.warning(msg)
+            else:
+                context.error(msg)
+
+
+# The outcome of checking one project in a worker thread. The
+# messages are held in a _MessageBuffer until they are reported.
+ProjectResult = collections.namedtuple(
+    'ProjectResult',
+    ['project', 'messages', 'checked_out', 'sha_exists', 'version_exists',
+     'actual_sha'],
+)
+
+
+def map_projects(func, projects):
+    """Call func for each project concurrently and return the results.
+
+    The projects in a release each live in a different repository, so
+    the git commands for them can safely run at the same time. The
+    results are returned in the same order as the projects.
+
+    """
+    if len(projects) < 2:
+        return [func(p) for p in projects]
+    workers = min(_MAX_PROJECT_WORKERS, len(projects))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(func, projects))
 
 
 def applies_to_current(f):
@@ -141,9 +233,129 @@ def applies_to_cycle(f):
     return decorated
 
 
-# Remember which tags already exist so we don't have to repeat the
-# expensive check.
-existing_tag_cache = collections.defaultdict(set)
+# Remember the answers to read-only git queries, since several
+# validators ask the same questions about the same repositories. The
+# keys include the workdir, so separate contexts do not share results.
+_git_query_cache = {}
+_git_query_lock = threading.Lock()
+
+
+def _cached_git_query(name, func, *args):
+    key = (name,) + args
+    with _git_query_lock:
+        if key in _git_query_cache:
+            return _git_query_cache[key]
+    # Run the query without holding the lock so other threads can
+    # work on other repositories in the mean time.
+    result = func(*args)
+    with _git_query_lock:
+        _git_query_cache[key] = result
+    return result
+
+
+# Keep one object checker process per repository, instead of running a
+# new git command for every commit and tag we look for.
+_object_checkers = {}
+
+
+def _close_object_checkers():
+    for checker in _object_checkers.values():
+        checker.close()
+
+
+atexit.register(_close_object_checkers)
+
+
+def _release_workdir(workdir, cleanup):
+    # Forget everything we know about the repositories in the workdir
+    # and stop their checker processes before removing it.
+    with _git_query_lock:
+        for key in [k for k in _object_checkers if k[0] == workdir]:
+            _object_checkers.pop(key).close()
+        for key in [k for k in _git_query_cache if k[1] == workdir]:
+            del _git_query_cache[key]
+    if cleanup:
+        shutil.rmtree(workdir, True)
+    else:
+        print('not cleaning up %s' % workdir)
+
+
+def _object_exists(workdir, repo, ref):
+    with _git_query_lock:
+        checker = _object_checkers.get((workdir, repo))
+        if checker is None or not checker.alive():
+            if checker is not None:
+                checker.close()
+            checker = gitutils.ObjectChecker(workdir, repo)
+            _object_checkers[(workdir, repo)] = checker
+    result = checker.exists(ref)
+    if not checker.alive():
+        # The process died before answering, so its answer means
+        # nothing and must not be cached. Ask git directly instead.
+        result = gitutils.commit_exists(workdir, repo, ref)
+    return result
+
+
+def _commit_exists(workdir, repo, ref):
+    return _cached_git_query(
+        'commit_exists', _object_exists, workdir, repo, ref)
+
+
+def _sha_for_tag(workdir, repo, version):
+    # Read all of the tags of the repository at once, and only fall
+    # back to asking git about this ref if it is not one of them.
+    tag_shas = _cached_git_query(
+        'get_tag_shas', gitutils.get_tag_shas, workdir, repo)
+    sha = tag_shas.get(str(version))
+    if sha:
+        return sha
+    return _cached_git_query(
+        'sha_for_tag', gitutils.sha_for_tag, workdir, repo, version)
+
+
+def _get_sdist_name(workdir, repo):
+    # Finding the name runs setup.py twice, which is slow, so remember
+    # it for each commit that is checked out.
+    head = None
+    if os.path.exists(os.path.join(workdir, repo, 'setup.py')):
+        head = gitutils.get_head(workdir, repo)
+    if head is None:
+        return pythonutils.get_sdist_name(workdir, repo)
+    return _cached_git_query(
+        'get_sdist_name', _get_sdist_name_at, workdir, repo, head)
+
+
+def _get_sdist_name_at(workdir, repo, head):
+    return pythonutils.get_sdist_name(workdir, repo)
+
+
+def _branch_tips(workdir, repo):
+    return _cached_git_query(
+        'get_branch_tips', gitutils.get_branch_tips, workdir, repo)
+
+
+def _branches_containing(workdir, repo, ref):
+    return _cached_git_query(
+        'branches_containing', gitutils.branches_containing,
+        workdir, repo, ref)
+
+
+def _check_branch_sha(workdir, repo, series, sha):
+    return _cached_git_query(
+        'check_branch_sha', _check_branch_sha_at, workdir, repo, series, sha)
+
+
+def _check_branch_sha_at(workdir, repo, series, sha):
+    return gitutils.check_branch_sha(
+        workdir, repo, series, sha,
+        branch_tips=_branch_tips(workdir, repo),
+    )
+
+
+def _check_ancestry(workdir, repo, old_version, sha):
+    return _cached_git_query(
+        'check_ancestry', gitutils.check_ancestry,
+        workdir, repo, old_version, sha)
 
 
 def includes_new_tag(deliv, context):
@@ -155,16 +367,12 @@ def includes_new_tag(deliv, context):
                 LOG.info('{} is retired, skipping'.format(project.repo.name))
                 continue
 
-            if release.version in existing_tag_cache[project.repo.name]:
-                LOG.debug('%s already tagged %s, skipping',
-                          project.repo.name, release.version)
-                continue
-
-            version_exists = gitutils.commit_exists(
+            # The answer is cached per workdir, so contexts working on
+            # different clones of the same repository do not share it.
+            version_exists = _commit_exists(
                 context.workdir, project.repo.name, release.version,
             )
             if version_exists:
-                existing_tag_cache[project.repo.name].add(release.version)
                 LOG.debug('%s already tagged %s, skipping',
                           project.repo.name, release.version)
             else:
@@ -232,9 +440,7 @@ def validate_series_open(deliv, context):
         os.path.dirname(previous_deliverable_file)
     )
     expected_branch = 'stable/' + previous_series
-    previous_deliverable = deliverable.Deliverable.read_file(
-        previous_deliverable_file
-    )
+    previous_deliverable = context.read_deliverable(previous_deliverable_file)
     for branch in previous_deliverable.branches:
         if branch.name == expected_branch:
             # Everything is OK
@@ -364,9 +570,9 @@ def validate_series_final(deliv, context):
         print('this rule only applies when tagging a final from a candidate')
         return
 
-    current_projects = sorted(releases[-1].projects)
-    previous_projects = sorted(previous_release.projects)
-    for c_proj, p_proj in zip(current_projects, previous_projects):
+    # The projects of a release are already sorted by repository.
+    for c_proj, p_proj in zip(current_release.projects,
+                              previous_release.projects):
         LOG.debug(
             'comparing {}:{} with {}:{}'.format(
                 c_proj.repo.name, c_proj.hash,
@@ -481,6 +687,22 @@ def validate_series_em(deliv, context):
                           (current_hash, previous_hash))
 
 
+def _get_launchpad_status(lp_name):
+    """Return the status code of a HEAD request for the launchpad project.
+
+    Connection errors are returned instead of raised so the result can
+    be cached and reported later.
+
+    """
+    try:
+        resp = _SESSION.head(_LAUNCHPAD_API + lp_name, allow_redirects=True,
+                             timeout=_HTTP_TIMEOUT)
+    except (requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout) as e:
+        return e
+    return resp.status_code
+
+
 @skip_em_eol_tags
 def validate_bugtracker(deliv, context):
     "Does the bug tracker info link to something that exists?"
@@ -488,21 +710,21 @@ def validate_bugtracker(deliv, context):
     sb_id = deliv.storyboard_id
     if lp_name:
         try:
-            lp_resp = requests.get('https://api.launchpad.net/1.0/' + lp_name)
-        except requests.exceptions.ConnectionError as e:
+            lp_status = context.launchpad_status(lp_name)
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout) as e:
             # The flakey Launchpad API failed. Don't punish the user for that.
             context.warning('Could not verify launchpad project %s (%s)' %
                             (lp_name, e))
         else:
-            if (lp_resp.status_code // 100) == 4:
+            if (lp_status // 100) == 4:
                 context.error('Launchpad project %s does not exist' % lp_name)
         print('launchpad project ID {} OK'.format(lp_name))
     elif sb_id:
         try:
-            projects_resp = requests.get(
-                'https://storyboard.openstack.org/api/v1/projects'
-            )
-        except requests.exceptions.ConnectionError as e:
+            projects_resp = context.storyboard_projects()
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout) as e:
             # The flakey Launchpad API failed. Don't punish the user for that.
             context.warning('Could not verify storyboard project %s (%s)' %
                             (sb_id, e))
@@ -511,13 +733,10 @@ def validate_bugtracker(deliv, context):
                 context.warning(
                     'Could not verify storyboard project, API call failed.'
                 )
-            for project in projects_resp.json():
-                # TODO(fungi): This can be changed to simply check
-                # that sb_id == project.get('name') later if all the
-                # data gets updated from numbers to names.
-                if sb_id in (project.get('id'), project.get('name')):
-                    break
-            else:
+            # TODO(fungi): This can be changed to simply check
+            # that sb_id == project.get('name') later if all the
+            # data gets updated from numbers to names.
+            if sb_id not in context.storyboard_project_keys():
                 context.error(
                     'Did not find a storyboard project with ID %s' % sb_id
                 )
@@ -564,8 +783,24 @@ def validate_release_notes(deliv, context):
         links = list(notes_link.values())
     else:
         links = [notes_link]
-    for link in links:
-        rn_resp = requests.get(link)
+
+    def fetch(link):
+        try:
+            return _SESSION.get(link, timeout=_HTTP_TIMEOUT)
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout) as e:
+            return e
+
+    # Fetch all of the pages at once, but report on them in order.
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(_MAX_LINK_WORKERS, len(links))) as executor:
+        responses = list(executor.map(fetch, links))
+
+    for link, rn_resp in zip(links, responses):
+        if isinstance(rn_resp, Exception):
+            context.error('Could not fetch release notes page %s: %s' %
+                          (link, rn_resp))
+            continue
         if (rn_resp.status_code // 100) != 2:
             context.error('Could not fetch release notes page %s: %s' %
                           (link, rn_resp.status_code))
@@ -577,17 +812,21 @@ def validate_release_notes(deliv, context):
 def validate_model(deliv, context):
     "Require a valid release model"
 
-    LOG.debug('release model {}'.format(deliv.model))
+    # Look the values up once, since the properties are recomputed
+    # every time they are used.
+    model = deliv.model
+    in_independent = deliv.is_independent
+
+    LOG.debug('release model {}'.format(model))
 
-    if not deliv.is_independent and not deliv.model:
+    if not in_independent and not model:
         # If the deliverable is not independent it must declare a
         # release model.
         context.error(
             'no release-model specified',
         )
 
-    if (deliv.model in ['independent', 'abandoned'] and
-            deliv.series != 'independent'):
+    if model in _INDEPENDENT_MODELS and not in_independent:
         # If the project is release:independent or abandoned, make sure
         # the deliverable file is in _independent.
         context.error(
@@ -600,19 +839,18 @@ def validate_model(deliv, context):
     # sure it is not in the _independent directory.  We have to
     # bypass the model property because that always returns
     # 'independent' for deliverables in that series.
-    model_value = deliv.data.get('release-model', 'independent')
-    if (deliv.series == 'independent' and
-            model_value not in ['independent', 'abandoned']):
+    if (in_independent and
+            deliv.data.get('release-model', 'independent')
+            not in _INDEPENDENT_MODELS):
         context.error(
             'deliverables in the _independent directory '
             'should use either the independent or abandoned release models'
         )
 
-    if deliv.model == 'untagged' and deliv.is_released:
+    if model == 'untagged' and deliv.is_released:
         context.error(
             'untagged deliverables should not have a "releases" section'
         )
-        return
 
 
 def clone_deliverable(deliv, context):
@@ -622,20 +860,61 @@ def clone_deliverable(deliv, context):
     performed as expected.
 
     """
-    cloned = set()
     ok = True
     for repo in deliv.repos:
-        if repo.name in cloned:
-            continue
         if repo.is_retired:
             LOG.info('{} is retired, skipping clone'.format(repo.name))
             continue
+        if repo.name in context.fetched_repos:
+            # The history is already up to date, so only go back to
+            # master instead of fetching from the remote again.
+            if not gitutils.checkout_ref(context.workdir, repo.name,
+                                         'master', context):
+                ok = False
+            continue
         if not gitutils.safe_clone_repo(context.workdir, repo.name,
                                         'master', context):
             ok = False
+            continue
+        context.fetched_repos.add(repo.name)
     return ok
 
 
+def prefetch_repositories(delivs, context):
+    """Clone the repositories for all of the deliverables in parallel.
+
+    Cloning is dominated by network time, so doing all of the clones
+    concurrently up front is much faster than waiting for
+    clone_deliverable() to fetch each repository in turn. Failures are
+    only logged here so that clone_deliverable() can report them
+    against the right deliverable file.
+
+    """
+    repos = sorted(set(
+        repo.name
+        for deliv in delivs
+        for repo in deliv.repos
+        if not repo.is_retired
+    ))
+    if not repos:
+        return
+
+    def clone(repo):
+        try:
+            gitutils.clone_repo(context.workdir, repo, 'master')
+        except Exception as err:
+            LOG.warning('Could not prefetch repository %s: %s', repo, err)
+            return None
+        return repo
+
+    LOG.debug('prefetching %d repositories', len(repos))
+    workers = min(_MAX_CLONE_WORKERS, len(repos))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        context.fetched_repos.update(
+            repo for repo in ex.map(clone, repos) if repo is not None
+        )
+
+
 def _require_gitreview(repo, context):
     LOG.debug('looking for .gitreview in %s' % repo)
     filename = os.path.join(
@@ -660,7 +939,7 @@ def validate_gitreview(deliv, context):
                 print('{} is retired, skipping'.format(
                     project.repo.name))
                 continue
-            version_exists = gitutils.commit_exists(
+            version_exists = _commit_exists(
                 context.workdir, project.repo.name, release.version,
             )
             if not version_exists:
@@ -720,7 +999,7 @@ def validate_release_type(deliv, context):
             LOG.debug('release-type not given, '
                       'guessing {!r}'.format(release_type))
 
-        version_exists = gitutils.commit_exists(
+        version_exists = _commit_exists(
             context.workdir, project.repo.name, release.version,
         )
 
@@ -754,13 +1033,12 @@ def validate_tarball_base(deliv, context):
             LOG.info('%s is retired, skipping', project.repo.name)
             continue
 
-        version_exists = gitutils.commit_exists(
+        version_exists = _commit_exists(
             context.workdir, project.repo.name, release.version,
         )
         # Check that the sdist name and tarball-base name match.
         try:
-            sdist = pythonutils.get_sdist_name(context.workdir,
-                                               project.repo.name)
+            sdist = _get_sdist_name(context.workdir, project.repo.name)
         except Exception as err:
             msg = 'Could not get the name of {} for version {}: {}'.format(
                 project.repo.name, release.version, err)
@@ -802,7 +1080,7 @@ def validate_build_sdist(deliv, context):
             LOG.info('%s is retired, skipping', project.repo.name)
             continue
 
-        version_exists = gitutils.commit_exists(
+        version_exists = _commit_exists(
             context.workdir, project.repo.name, release.version,
         )
         if version_exists:
@@ -916,7 +1194,7 @@ def validate_pypi_permissions(deliv, context):
 
         if not pypi_name:
             try:
-                sdist = pythonutils.get_sdist_name(context.workdir, repo.name)
+                sdist = _get_sdist_name(context.workdir, repo.name)
             except Exception as err:
                 context.warning(
                     'Could not determine the sdist name '
@@ -966,23 +1244,14 @@ def validate_deliverable_is_not_abandoned(deliv, context):
         context.error('Abandoned deliverables should not see new releases')
 
 
-@skip_existing_tags
 @applies_to_released
-def validate_release_sha_exists(deliv, context):
-    "Ensure the hashes for each release exist."
-
+def validate_release_hashes(deliv, context):
+    "Ensure the hashes for each release look like commit SHAs."
     for release in deliv.releases:
-
-        LOG.debug('checking {}'.format(release.version))
-
         for project in release.projects:
             if project.repo.is_retired:
                 LOG.info('%s is retired, skipping', project.repo.name)
                 continue
-
-            # Check the SHA specified for the tag.
-            LOG.debug('{} SHA {}'.format(project.repo.name, project.hash))
-
             if not is_a_hash(project.hash):
                 context.error(
                     ('%(repo)s version %(version)s release from '
@@ -991,69 +1260,122 @@ def validate_release_sha_exists(deliv, context):
                          'hash': project.hash,
                          'version': release.version}
                 )
+
+
+@skip_existing_tags
+@applies_to_released
+def validate_release_sha_exists(deliv, context):
+    "Ensure the hashes for each release exist."
+
+    def check(project):
+        messages = _MessageBuffer()
+        checked_out = gitutils.checkout_ref(
+            context.workdir, project.repo.name, project.hash, messages)
+        # Report if the SHA exists or not (an error if it
+        # does not).
+        sha_exists = checked_out and _commit_exists(
+            context.workdir, project.repo.name, project.hash,
+        )
+        return ProjectResult(
+            project=project,
+            messages=messages,
+            checked_out=checked_out,
+            sha_exists=sha_exists,
+            version_exists=None,
+            actual_sha=None,
+        )
+
+    for release in deliv.releases:
+
+        LOG.debug('checking {}'.format(release.version))
+
+        to_check = []
+        for project in release.projects:
+            if project.repo.is_retired:
+                LOG.info('%s is retired, skipping', project.repo.name)
                 continue
 
-            if not gitutils.checkout_ref(context.workdir, project.repo.name,
-                                         project.hash, context):
+            # Check the SHA specified for the tag. Its format has
+            # already been checked by validate_release_hashes().
+            LOG.debug('{} SHA {}'.format(project.repo.name, project.hash))
+            to_check.append(project)
+
+        for result in map_projects(check, to_check):
+            result.messages.report(context)
+            if not result.checked_out:
                 continue
 
-            print('successfully cloned {}'.format(project.hash))
+            print('successfully cloned {}'.format(result.project.hash))
 
-            # Report if the SHA exists or not (an error if it
-            # does not).
-            sha_exists = gitutils.commit_exists(
-                context.workdir, project.repo.name, project.hash,
-            )
-            if not sha_exists:
+            if not result.sha_exists:
                 context.error('No commit %(hash)r in %(repo)r'
-                              % {'hash': project.hash,
-                                 'repo': project.repo.name})
+                              % {'hash': result.project.hash,
+                                 'repo': result.project.repo.name})
 
 
 @applies_to_released
 def validate_existing_tags(deliv, context):
     "Ensure tags that exist point to the SHAs listed."
 
+    def check(project):
+        messages = _MessageBuffer()
+        checked_out = gitutils.checkout_ref(
+            context.workdir, project.repo.name, project.hash, messages)
+        # Report if the version has already been
+        # tagged. We expect it to not exist, but neither
+        # case is an error because sometimes we want to
+        # import history and sometimes we want to make new
+        # releases.
+        version_exists = checked_out and _commit_exists(
+            context.workdir, project.repo.name, release.version,
+        )
+        actual_sha = None
+        if version_exists:
+            actual_sha = _sha_for_tag(
+                context.workdir,
+                project.repo.name,
+                release.version,
+            )
+        return ProjectResult(
+            project=project,
+            messages=messages,
+            checked_out=checked_out,
+            sha_exists=None,
+            version_exists=version_exists,
+            actual_sha=actual_sha,
+        )
+
     for release in deliv.releases:
 
         LOG.debug('checking {}'.format(release.version))
 
+        to_check = []
         for project in release.projects:
             if project.repo.is_retired:
                 LOG.info('%s is retired, skipping', project.repo.name)
                 continue
 
             LOG.debug('{} SHA {}'.format(project.repo.name, project.hash))
+            to_check.append(project)
 
-            if not gitutils.checkout_ref(context.workdir, project.repo.name,
-                                         project.hash, context):
+        for result in map_projects(check, to_check):
+            result.messages.report(context)
+            if not result.checked_out:
                 continue
 
-            # Report if the version has already been
-            # tagged. We expect it to not exist, but neither
-            # case is an error because sometimes we want to
-            # import history and sometimes we want to make new
-            # releases.
-            version_exists = gitutils.commit_exists(
-                context.workdir, project.repo.name, release.version,
-            )
-            if not version_exists:
+            project = result.project
+            if not result.version_exists:
                 print('{} does not have {} tag yet, skipping'.format(
                     project.repo.name, release.version))
                 continue
 
-            actual_sha = gitutils.sha_for_tag(
-                context.workdir,
-                project.repo.name,
-                release.version,
-            )
-            if actual_sha != project.hash:
+            if result.actual_sha != project.hash:
                 context.error(
                     'Version {} in {} is on '
                     'commit {!r} instead of {!r}'.format(
                         release.version,
                         project.repo.name,
-                        actual_sha,
+                        result.actual_sha,
                         project.hash)
                 )
             else:
@@ -1066,6 +1388,16 @@ def validate_existing_tags(deliv, context):
 def validate_version_numbers(deliv, context):
     "Ensure the version numbers are valid."
 
+    # For the master branch, enforce the requirements rules. For other
+    # branches just warn if the rules are broken because there are
+    # cases where we do need to support point releases with
+    # requirements updates. This is the same for every release, so
+    # decide once.
+    if deliv.series == defaults.RELEASE:
+        report_requirements = context.error
+    else:
+        report_requirements = context.warning
+
     # Track the previous version tag attached to each repository, by
     # name.
     prev_version = {}
@@ -1108,7 +1440,7 @@ def validate_version_numbers(deliv, context):
                                          project.hash, context):
                 continue
 
-            version_exists = gitutils.commit_exists(
+            version_exists = _commit_exists(
                 context.workdir, project.repo.name, release.version,
             )
             if version_exists:
@@ -1188,20 +1520,11 @@ def validate_version_numbers(deliv, context):
             # not reflecting the version.
             if (prev_version.get(project.repo.name) and
                     release_type in _PYTHON_RELEASE_TYPES):
-                # For the master branch, enforce the
-                # rules. For other branches just warn if
-                # the rules are broken because there are
-                # cases where we do need to support point
-                # releases with requirements updates.
-                if deliv.series == defaults.RELEASE:
-                    report = context.error
-                else:
-                    report = context.warning
                 requirements.find_bad_lower_bound_increases(
                     context.workdir, project.repo.name,
                     prev_version.get(project.repo.name),
                     release.version, project.hash,
-                    report,
+                    report_requirements,
                 )
 
             had_error = False
@@ -1242,7 +1565,7 @@ def validate_new_releases_at_end(deliv, context):
                                          project.hash, context):
                 continue
 
-            version_exists = gitutils.commit_exists(
+            version_exists = _commit_exists(
                 context.workdir, project.repo.name, release.version,
             )
             if version_exists:
@@ -1290,7 +1613,7 @@ def validate_new_releases_in_open_series(deliv, context):
                                          project.hash, context):
                 continue
 
-            version_exists = gitutils.commit_exists(
+            version_exists = _commit_exists(
                 context.workdir, project.repo.name, release.version,
             )
             if version_exists:
@@ -1345,7 +1668,7 @@ def validate_release_branch_membership(deliv, context):
                                          project.hash, context):
                 continue
 
-            version_exists = gitutils.commit_exists(
+            version_exists = _commit_exists(
                 context.workdir, project.repo.name, release.version,
             )
             if version_exists:
@@ -1358,10 +1681,10 @@ def validate_release_branch_membership(deliv, context):
             # If this is the first version in the series,
             # check that the commit is actually on the
             # targeted branch.
-            if not gitutils.check_branch_sha(context.workdir,
-                                             project.repo.name,
-                                             deliv.series,
-                                             project.hash):
+            if not _check_branch_sha(context.workdir,
+                                     project.repo.name,
+                                     deliv.series,
+                                     project.hash):
                 msg = '%s %s not present in %s branch' % (
                     project.repo.name,
                     project.hash,
@@ -1375,20 +1698,20 @@ def validate_release_branch_membership(deliv, context):
 
             # Check to see if we are re-tagging the same
             # commit with a new version.
-            old_sha = gitutils.sha_for_tag(
+            old_sha = _sha_for_tag(
                 context.workdir,
                 project.repo.name,
                 prev_version[project.repo.name],
             )
-            if old_sha == project.hash:
-                # FIXME(dhellmann): This needs a test.
+            if old_sha.lower() == project.hash.lower():
+                # There is nothing new to check, so skip running git.
                 LOG.debug('The SHA is being retagged with a new version')
             else:
                 # Check to see if the commit for the new
                 # version is in the ancestors of the
                 # previous release, meaning it is actually
                 # merged into the branch.
-                is_ancestor = gitutils.check_ancestry(
+                is_ancestor = _check_ancestry(
                     context.workdir,
                     project.repo.name,
                     prev_version[project.repo.name],
@@ -1435,32 +1758,30 @@ def validate_new_releases(deliv, context):
         p.repo.name
         for p in final_release.projects
     )
-    for extra in actual_repos.difference(expected_repos):
+    for extra in sorted(actual_repos.difference(expected_repos)):
         context.warning(
             'release %s includes repository %s '
             'that is not in the governance list' %
             (final_release.version, extra)
         )
-    for missing in expected_repos.difference(actual_repos):
+    for missing in sorted(expected_repos.difference(actual_repos)):
         context.warning(
             'release %s is missing %s, '
             'which appears in the governance list: %s' %
             (final_release.version, missing, expected_repos)
         )
-    for repo in actual_repos:
-        if repo not in deliv.known_repo_names:
-            context.error(
-                'release %s includes repository %s '
-                'that is not in the repository-settings section' %
-                (final_release.version, repo)
-            )
-    for missing in deliv.known_repo_names:
-        if missing not in actual_repos:
-            context.error(
-                'release %s is missing %s, '
-                'which appears in the repository-settings list' %
-                (final_release.version, missing)
-            )
+    for repo in sorted(actual_repos.difference(deliv.known_repo_names)):
+        context.error(
+            'release %s includes repository %s '
+            'that is not in the repository-settings section' %
+            (final_release.version, repo)
+        )
+    for missing in sorted(deliv.known_repo_names.difference(actual_repos)):
+        context.error(
+            'release %s is missing %s, '
+            'which appears in the repository-settings list' %
+            (final_release.version, missing)
+        )
 
 
 def validate_branch_prefixes(deliv, context):
@@ -1468,7 +1789,7 @@ def validate_branch_prefixes(deliv, context):
     for branch in deliv.branches:
         if branch.prefix not in _VALID_BRANCH_PREFIXES:
             context.error('branch name %s does not use a valid prefix: %s' % (
-                branch.name, _VALID_BRANCH_PREFIXES))
+                branch.name, _VALID_BRANCH_PREFIX_LIST))
 
 
 def validate_stable_branches(deliv, context):
@@ -1494,10 +1815,6 @@ def validate_stable_branches(deliv, context):
         print('rule does not apply to end-of-life repos, skipping')
         return
 
-    known_series = sorted(list(
-        d for d in os.listdir('deliverables')
-        if not d.startswith('_')
-    ))
     for branch in deliv.branches:
         try:
             prefix, series = branch.name.split('/')
@@ -1580,7 +1897,7 @@ def validate_stable_branches(deliv, context):
                 if not gitutils.checkout_ref(context.workdir, repo, loc,
                                              context):
                     continue
-                if not gitutils.commit_exists(context.workdir, repo, loc):
+                if not _commit_exists(context.workdir, repo, loc):
                     context.error(
                         ('stable branches should be created from merged '
                          'commits but location %s for branch %s of %s '
@@ -1607,6 +1924,12 @@ def validate_stable_branches(deliv, context):
             )
 
         elif deliv.is_independent:
+            # Only independent deliverables need the list of series, so
+            # do not read the directory for the others.
+            known_series = sorted(
+                d for d in os.listdir('deliverables')
+                if not d.startswith('_')
+            )
             if series not in known_series:
                 context.error(
                     ('stable branches must be named for known series '
@@ -1673,7 +1996,7 @@ def validate_feature_branches(deliv, context):
                      'like a SHA' % (
                          (loc, repo, branch.name)))
                 )
-            if not gitutils.commit_exists(context.workdir, repo, loc):
+            if not _commit_exists(context.workdir, repo, loc):
                 context.error(
                     ('feature branches should be created from merged commits '
                      'but location %s for branch %s of %s does not exist' % (
@@ -1707,25 +2030,31 @@ def validate_branch_points(deliv, context):
             branch.name,
         ])
 
-        location = branch.get_repo_map()
+        try:
+            location = branch.get_repo_map()
+        except ValueError as err:
+            # validate_stable_branches reports the unknown version.
+            print('{}, skipping'.format(err))
+            continue
 
         for repo, hash in sorted(location.items()):
             if deliv.get_repo(repo).is_retired:
                 continue
             LOG.debug('checking repo {}'.format(repo))
-            existing_branches = sorted([
+            # Reuse the branch list that the other branch checks read
+            # instead of asking git again for every branch point.
+            existing_branches = set(
                 (b.partition('/origin/')[-1]
                  if b.startswith('remotes/origin/')
                  else b)
-                for b in gitutils.get_branches(context.workdir, repo)
-            ])
+                for b in _branch_tips(context.workdir, repo)
+            )
 
             # Remove the remote name prefix if it is present in the
             # branch name.
             containing = set(
                 c.partition('/')[-1] if c.startswith('origin/') else c
-                for c in gitutils.branches_containing(
-                    context.workdir, repo, hash)
+                for c in _branches_containing(context.workdir, repo, hash)
             )
 
             LOG.debug('found {} on branches {} in {}'.format(
@@ -1771,29 +2100,38 @@ def validate_branch_points(deliv, context):
 
 class ValidationContext(object):
 
-    _zuul_projects = None
-    _gov_data = None
+    # Every check reports through the context, so use slots to make
+    # the attribute lookups cheaper.
+    __slots__ = ('warnings', 'errors', 'debug', 'cleanup', 'filename',
+                 'workdir', 'function_name', '_launchpad_status',
+                 '_zuul_projects', '_gov_data', '_storyboard_projects',
+                 '_storyboard_project_keys', 'fetched_repos',
+                 '_deliverables', '__weakref__')
 
-    def __init__(self, debug=False, cleanup=True):
+    def __init__(self, debug=False, cleanup=True, workdir_root=None):
         self.warnings = []
         self.errors = []
         self.debug = debug
         self.cleanup = cleanup
         self.filename = None
-        self._setup_workdir()
+        self._setup_workdir(workdir_root)
         self.function_name = 'unknown'
-
-    def _setup_workdir(self):
-        workdir = tempfile.mkdtemp(prefix='releases-')
+        self._launchpad_status = {}
+        self._zuul_projects = None
+        self._gov_data = None
+        self._storyboard_projects = None
+        self._storyboard_project_keys = None
+        # The repositories in the workdir that have been brought up
+        # to date with their remotes.
+        self.fetched_repos = set()
+        self._deliverables = {}
+
+    def _setup_workdir(self, workdir_root=None):
+        workdir = tempfile.mkdtemp(prefix='releases-', dir=workdir_root)
         LOG.debug('creating temporary files in {}'.format(workdir))
-
-        def cleanup_workdir():
-            if self.cleanup:
-                shutil.rmtree(workdir, True)
-            else:
-                print('not cleaning up %s' % workdir)
-        atexit.register(cleanup_workdir)
-
+        # Release the workdir when the context is garbage collected, or
+        # at exit, without the cleanup callback keeping the context alive.
+        weakref.finalize(self, _release_workdir, workdir, self.cleanup)
         self.workdir = workdir
 
     def set_filename(self, filename):
@@ -1814,16 +2152,95 @@ class ValidationContext(object):
         if self.debug:
             raise RuntimeError(msg)
 
+    def prefetch_launchpad_status(self, names):
+        """Start looking up a batch of launchpad projects concurrently.
+
+        The requests share a pooled session so the TLS connections are
+        reused. They run in the background, so the caller can go on
+        with the git work while they finish, and launchpad_status()
+        waits for the answer it needs.
+
+        """
+        names = sorted(set(names) - set(self._launchpad_status))
+        if not names:
+            return
+        LOG.debug('prefetching %d launchpad projects', len(names))
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(_MAX_LAUNCHPAD_WORKERS, len(names)),
+        )
+        for name in names:
+            self._launchpad_status[name] = executor.submit(
+                _get_launchpad_status, name)
+        # Let the queued lookups finish on their own, without blocking.
+        executor.shutdown(wait=False)
+
+    def launchpad_status(self, name):
+        """Return the HTTP status code for the launchpad project.
+
+        Raises requests.exceptions.ConnectionError or
+        requests.exceptions.Timeout if the API could not be reached.
+
+        """
+        if name not in self._launchpad_status:
+            self._launchpad_status[name] = _get_launchpad_status(name)
+        result = self._launchpad_status[name]
+        if isinstance(result, concurrent.futures.Future):
+            result = result.result()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def storyboard_projects(self):
+        """Return the response listing all of the storyboard projects.
+
+        The list is the same for every deliverable, so it is only
+        fetched once.
+
+        """
+        if self._storyboard_projects is None:
+            self._storyboard_projects = _SESSION.get(
+                _STORYBOARD_API, timeout=_HTTP_TIMEOUT)
+        return self._storyboard_projects
+
+    def storyboard_project_keys(self):
+        """Return the set of storyboard project IDs and names.
+
+        Deliverables may refer to a project by either, so index both
+        once instead of scanning the project list for each deliverable.
+
+        """
+        if self._storyboard_project_keys is None:
+            keys = set()
+            for project in self.storyboard_projects().json():
+                keys.add(project.get('id'))
+                keys.add(project.get('name'))
+            self._storyboard_project_keys = frozenset(keys)
+        return self._storyboard_project_keys
+
+    def add_deliverables(self, delivs):
+        "Remember deliverables that have already been read, by filename."
+        self._deliverables.update(delivs)
+
+    def read_deliverable(self, filename):
+        "Return the deliverable in the file, reading it only once."
+        deliv = self._deliverables.get(filename)
+        if deliv is None:
+            deliv = deliverable.Deliverable.read_file(filename)
+            self._deliverables[filename] = deliv
+        return deliv
+
     def show_summary(self):
         header('Summary')
 
+        # There can be a lot of messages, so write each list at once
+        # instead of line by line.
         print('\n\n%s warnings found' % len(self.warnings))
-        for w in self.warnings:
-            print(w)
+        if self.warnings:
+            print('\n'.join(self.warnings))
 
         print('\n\n%s errors found' % len(self.errors))
-        for e in self.errors:
-            print(e)
+        if self.errors:
+            print('\n'.join(self.errors))
 
     @property
     def zuul_projects(self):
@@ -1838,6 +2255,81 @@ class ValidationContext(object):
         return self._gov_data
 
 
+# Checks that only look at the contents of the deliverable file.
+_STATIC_CHECKS = [
+    validate_model,
+    validate_branch_prefixes,
+    validate_release_hashes,
+]
+
+# Checks that need the git repositories or other services.
+_CHECKS = [
+    clone_deliverable,
+    validate_bugtracker,
+    validate_team,
+    validate_release_notes,
+    validate_release_type,
+    validate_pypi_permissions,
+    validate_build_sdist,
+    # Check readme after sdist build to slightly optimize things
+    validate_pypi_readme,
+    validate_gitreview,
+    validate_deliverable_is_not_abandoned,
+    validate_release_sha_exists,
+    validate_existing_tags,
+    validate_version_numbers,
+    validate_new_releases_at_end,
+    validate_new_releases_in_open_series,
+    validate_release_branch_membership,
+    validate_tarball_base,
+    validate_new_releases,
+    validate_series_open,
+    validate_series_first,
+    validate_series_final,
+    validate_pre_release_progression,
+    validate_series_eol,
+    validate_series_em,
+    validate_stable_branches,
+    validate_feature_branches,
+    validate_branch_points,
+]
+
+
+@contextlib.contextmanager
+def buffered_output():
+    """Collect everything printed or logged, then write it all at once.
+
+    The report for each file is written in one go instead of flushing
+    the output for every line.
+
+    """
+    stdout = sys.stdout
+    buffer = io.StringIO()
+    handlers = [
+        h for h in logging.getLogger().handlers
+        if isinstance(h, logging.StreamHandler) and h.stream is stdout
+    ]
+    for h in handlers:
+        h.stream = buffer
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        for h in handlers:
+            h.stream = stdout
+        stdout.write(buffer.getvalue())
+        stdout.flush()
+
+
+def run_checks(checks, deliv, context):
+    "Run each of the checks against the deliverable."
+    for check in checks:
+        title = inspect.getdoc(check).splitlines()[0].strip()
+        header(title)
+        context.set_function(check)
+        check(deliv, context)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -1853,6 +2345,12 @@ def main():
         action='store_true',
         help='throw exception on error',
     )
+    parser.add_argument(
+        '--workdir-root',
+        default=None,
+        help=('directory for the temporary git clones, such as a tmpfs, '
+              'defaults to the system temporary directory'),
+    )
     parser.add_argument(
         'input',
         nargs='*',
@@ -1878,60 +2376,52 @@ def main():
     context = ValidationContext(
         debug=args.debug,
         cleanup=args.cleanup,
+        workdir_root=args.workdir_root,
     )
 
+    delivs = {
+        filename: deliverable.Deliverable.read_file(filename)
+        for filename in filenames
+        if os.path.isfile(filename)
+    }
+    context.add_deliverables(delivs)
+
+    # Run the checks that only look at the file contents first, and
+    # leave out files with errors from the ones that need to run git
+    # or query other services.
+    active = []
     for filename in filenames:
-        header('Checking %s' % filename, '=')
+        with buffered_output():
+            header('Static checks for %s' % filename, '=')
 
-        if not os.path.isfile(filename):
-            print("File was deleted, skipping.")
-            continue
+            if filename not in delivs:
+                print("File was deleted, skipping.")
+                continue
 
-        context.set_filename(filename)
+            context.set_filename(filename)
 
-        deliv = deliverable.Deliverable.read_file(filename)
+            deliv = delivs[filename]
 
-        if deliv.series in _CLOSED_SERIES:
-            print('File is part of a closed series, skipping')
-            continue
+            if deliv.series in _CLOSED_SERIES:
+                print('File is part of a closed series, skipping')
+                continue
 
-        checks = [
-            clone_deliverable,
-            validate_bugtracker,
-            validate_team,
-            validate_release_notes,
-            validate_model,
-            validate_release_type,
-            validate_pypi_permissions,
-            validate_build_sdist,
-            # Check readme after sdist build to slightly optimize things
-            validate_pypi_readme,
-            validate_gitreview,
-            validate_deliverable_is_not_abandoned,
-            validate_release_sha_exists,
-            validate_existing_tags,
-            validate_version_numbers,
-            validate_new_releases_at_end,
-            validate_new_releases_in_open_series,
-            validate_release_branch_membership,
-            validate_tarball_base,
-            validate_new_releases,
-            validate_series_open,
-            validate_series_first,
-            validate_series_final,
-            validate_pre_release_progression,
-            validate_series_eol,
-            validate_series_em,
-            validate_branch_prefixes,
-            validate_stable_branches,
-            validate_feature_branches,
-            validate_branch_points,
-        ]
-        for check in checks:
-            title = inspect.getdoc(check).splitlines()[0].strip()
-            header(title)
-            context.set_function(check)
-            check(deliv, context)
+            num_errors = len(context.errors)
+            run_checks(_STATIC_CHECKS, deliv, context)
+            if len(context.errors) == num_errors:
+                active.append(filename)
+
+    active_delivs = [delivs[filename] for filename in active]
+    context.prefetch_launchpad_status(
+        d.launchpad_id for d in active_delivs if d.launchpad_id
+    )
+    prefetch_repositories(active_delivs, context)
+
+    for filename in active:
+        with buffered_output():
+            header('Checking %s' % filename, '=')
+            context.set_filename(filename)
+            run_checks(_CHECKS, delivs[filename], context)
 
     context.show_summary()
 
@@ -28,6 +28,21 @@ from openstack_releases import series_status
 from openstack_releases import yamlutils
 
 
+_MILESTONE_MODELS = frozenset(['cycle-with-milestones', 'cycle-with-rc'])
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_semver(v):
+    """Return the SemanticVersion for the version string.
+
+    Collapsing the history sorts on the parsed versions and then looks
+    at them again, so only parse each string once.
+
+    """
+    return pbr.version.SemanticVersion.from_pip_string(v)
+
+
+@functools.lru_cache(maxsize=4096)
 def _safe_semver(v):
     """Get a SemanticVersion that closely represents the version string.
 
@@ -35,7 +50,8 @@ def _safe_semver(v):
     legacy tags don't comply with the parser. This method corrects
     some of the more common mistakes in formatting to make it more
     likely we can construct a SemanticVersion, even if the results
-    don't quite match the input.
+    don't quite match the input. The results are cached, so sorting
+    the history does not clean up the same strings again.
 
     """
     v = str(v)
@@ -55,7 +71,7 @@ def _safe_semver(v):
         else:
             parts = parts[:3]
         v = '.'.join(parts)
-    return pbr.version.SemanticVersion.from_pip_string(v)
+    return _parse_semver(v)
 
 
 def _version_sort_key(release):
@@ -83,8 +99,7 @@ def _collapse_deliverable_history(name, info):
     known_versions = set()
     for r in reversed(sorted_releases):
         try:
-            parsed_vers = pbr.version.SemanticVersion.from_pip_string(
-                str(r['version']))
+            parsed_vers = _parse_semver(str(r['version']))
             vers_tuple = parsed_vers.version_tuple()
         except Exception:
             # If we can't parse the version, it must be some sort
@@ -122,6 +137,9 @@ class Deliverables(object):
         self._by_deliverable_name = collections.defaultdict(list)
         # Map filenames to parsed content.
         self._by_filename = {}
+        # Map filenames to the Deliverable built from the content,
+        # so it can be handed out again instead of rebuilt.
+        self._deliverables = {}
 
         self._load_deliverable_files(root_dir)
 
@@ -131,7 +149,7 @@ class Deliverables(object):
             series = self._series_from_filename(filename)
             deliverable = self._deliverable_from_filename(filename)
             with open(filename, 'r', encoding='utf-8') as f:
-                d_info = yamlutils.loads(f.read())
+                d_info = yamlutils.safe_load(f)
                 if self._collapse_history:
                     _collapse_deliverable_history(deliverable, d_info)
             team = d_info['team']
@@ -155,6 +173,7 @@ class Deliverables(object):
         self._team_deliverables[team].add(deliverable)
         self._team_series[team].add(series)
         d = Deliverable(team, series, deliverable, d_info)
+        self._deliverables[filename] = d
         if d.allows_releases:
             self._active_teams.add(team)
         deliv = self._deliverable_from_filename(filename)
@@ -191,27 +210,19 @@ class Deliverables(object):
         else:
             filenames = self._by_team_and_series[(team, series)]
         for filename in filenames:
-            yield Deliverable(
-                team,
-                self._series_from_filename(filename),
-                self._deliverable_from_filename(filename),
-                self._by_filename.get(filename, {}),
-            )
+            yield self._deliverables[filename]
 
     def get_deliverable_history(self, name):
         """Return info associated with a deliverable name."""
         for filename in self._by_deliverable_name.get(name, []):
-            yield Deliverable(
-                None,  # team will be taken from the data
-                self._series_from_filename(filename),
-                self._deliverable_from_filename(filename),
-                self._by_filename.get(filename, {}),
-            )
+            yield self._deliverables[filename]
 
 
 @functools.total_ordering
 class Repo(object):
 
+    __slots__ = ('name', '_data', 'deliv')
+
     def __init__(self, name, data, deliv):
         self.name = name
         self._data = data
@@ -254,6 +265,8 @@ class Repo(object):
 @functools.total_ordering
 class ReleaseProject(object):
 
+    __slots__ = ('_repo', 'repo', 'hash', '_data', 'release')
+
     def __init__(self, repo, hash, data, release=None):
         self._repo = repo
         self.repo = release.deliv.get_repo(repo)
@@ -279,6 +292,12 @@ class ReleaseProject(object):
 
 class Release(object):
 
+    # There is one of these for every release of every deliverable, so
+    # keep them small. The projects refer to their release through a
+    # weakref.
+    __slots__ = ('version', 'deliv', '_data', '_projects',
+                 '_sorted_projects', '__weakref__')
+
     def __init__(self, version, projects, data, deliv):
         self.version = version
         if deliv:
@@ -290,6 +309,9 @@ class Release(object):
             p['repo']: ReleaseProject(p['repo'], p['hash'], p, self)
             for p in projects
         }
+        # The validators walk the projects over and over, so only sort
+        # them once.
+        self._sorted_projects = sorted(self._projects.values())
 
     @property
     def was_forced(self):
@@ -301,7 +323,7 @@ class Release(object):
 
     @property
     def projects(self):
-        return sorted(self._projects.values())
+        return list(self._sorted_projects)
 
     def project(self, repo):
         if repo in self._projects:
@@ -350,6 +372,8 @@ class Release(object):
 
 class Branch(object):
 
+    __slots__ = ('name', 'location', 'deliv', '_data')
+
     def __init__(self, name, location, data, deliv):
         self.name = name
         self.location = location
@@ -381,6 +405,12 @@ class Branch(object):
 @functools.total_ordering
 class Deliverable(object):
 
+    # The repos, releases and branches refer back to their deliverable
+    # through a weakref.
+    __slots__ = ('team', 'series', 'name', '_data', '_known_repo_names',
+                 '_repos', '_releases', '_releases_by_version', '_branches',
+                 '__weakref__')
+
     _gov_data = None
     _series_status_data = None
 
@@ -391,7 +421,11 @@ class Deliverable(object):
         self.series = series
         self.name = name
         self._data = data
-        repos = set(self._data.get('repository-settings', {}).keys())
+        repo_settings = self._data.get('repository-settings', {})
+        # The validators check membership in this set for every
+        # project of every release, so only build it once.
+        self._known_repo_names = frozenset(repo_settings.keys())
+        repos = set(self._known_repo_names)
         # NOTE(dhellmann): We do this next bit for legacy deliverable
         # files without the repository-settings sections. We should be
         # able to remove this after the T series is opened because at
@@ -403,7 +437,7 @@ class Deliverable(object):
         self._repos = {
             r: Repo(
                 name=r,
-                data=self._data.get('repository-settings', {}).get(r, {}),
+                data=repo_settings.get(r, {}),
                 deliv=self,
             )
             for r in sorted(repos)
@@ -417,6 +451,7 @@ class Deliverable(object):
             )
             for r in self._data.get('releases') or []
         ]
+        self._releases_by_version = None
         self._branches = [
             Branch(
                 name=b['name'],
@@ -430,7 +465,7 @@ class Deliverable(object):
     @classmethod
     def read_file(cls, filename):
         with open(filename, 'r', encoding='utf-8') as f:
-            data = yamlutils.loads(f.read())
+            data = yamlutils.safe_load(f)
 
         series_name = os.path.basename(
             os.path.dirname(filename)
@@ -458,7 +493,7 @@ class Deliverable(object):
 
     @property
     def known_repo_names(self):
-        return set(self._data.get('repository-settings', {}).keys())
+        return self._known_repo_names
 
     def get_repo(self, name):
         return self._repos[name]
@@ -480,7 +515,7 @@ class Deliverable(object):
 
     @property
     def is_released(self):
-        return len(self._data.get('releases') or []) > 0
+        return bool(self._releases)
 
     @property
     def is_cycle_based(self):
@@ -488,7 +523,7 @@ class Deliverable(object):
 
     @property
     def is_milestone_based(self):
-        return self.model in ['cycle-with-milestones', 'cycle-with-rc']
+        return self.model in _MILESTONE_MODELS
 
     @property
     def is_branchless(self):
@@ -551,10 +586,18 @@ class Deliverable(object):
         return self._releases
 
     def get_release(self, version):
-        for r in self.releases:
-            if r.version == version:
-                return r
-        raise ValueError('Unknown version {}'.format(version))
+        # Every branch looks up the release it was created from, so
+        # index the releases the first time one is needed. Iterate in
+        # reverse so the first release with a version is the one kept.
+        if self._releases_by_version is None:
+            self._releases_by_version = {
+                r.version: r
+                for r in reversed(self._releases)
+            }
+        try:
+            return self._releases_by_version[version]
+        except KeyError:
+            raise ValueError('Unknown version {}'.format(version))
 
     @property
     def branches(self):
@@ -12,10 +12,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import logging
 import os
 import os.path
 import subprocess
+import threading
 
 from openstack_releases import links
 from openstack_releases import processutils
@@ -28,6 +30,11 @@ LOG = logging.getLogger(__name__)
 
 GIT_TAG_TEMPLATE = 'https://opendev.org/%s/src/tag/%s'
 
+# Clones may be run from several threads at once, so serialize the
+# work for any one destination directory.
+_clone_locks = collections.defaultdict(threading.Lock)
+_clone_locks_guard = threading.Lock()
+
 
 def find_modified_deliverable_files():
     "Return a list of files modified by the most recent commit."
@@ -68,17 +75,81 @@ def commit_exists(workdir, repo, ref):
     The commit must have been merged into the repository, but this
     check does not enforce any branch membership.
     """
+    # Only ask whether the object exists, instead of having git show
+    # format the whole commit.
     try:
-        processutils.check_output(
-            ['git', 'show', ref],
+        processutils.check_call(
+            ['git', 'cat-file', '-e', ref],
             cwd=os.path.join(workdir, repo),
-        ).decode('utf-8')
+        )
     except processutils.CalledProcessError as err:
         LOG.error('Could not find {}: {}'.format(ref, err))
         return False
     return True
 
 
+class ObjectChecker(object):
+    """Check whether references exist using one long-running git process.
+
+    Feeding the references to a single ``git cat-file --batch-check``
+    is much cheaper than running commit_exists() for each of them. The
+    checker may be shared between threads.
+
+    """
+
+    def __init__(self, workdir, repo):
+        self.repo = repo
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            ['git', 'cat-file', '--batch-check=%(objectname) %(objecttype)'],
+            cwd=os.path.join(workdir, repo),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def exists(self, ref):
+        "Return boolean specifying whether the reference exists."
+        ref = str(ref)
+        # The references are sent one per line.
+        if '\n' in ref:
+            LOG.error('Could not find {}: invalid reference'.format(ref))
+            return False
+        with self._lock:
+            try:
+                self._proc.stdin.write(ref.encode('utf-8') + b'\n')
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline().decode('utf-8')
+            except (OSError, ValueError) as err:
+                line = ''
+                LOG.debug('git cat-file failed for {}: {}'.format(
+                    self.repo, err))
+        # Unknown references are reported as "<ref> missing" or
+        # "<ref> ambiguous", and a dead process gives no output.
+        result = line.split()
+        if not result or result[-1] in ('missing', 'ambiguous'):
+            LOG.error('Could not find {} in {}'.format(ref, self.repo))
+            return False
+        return True
+
+    def alive(self):
+        "Return boolean specifying whether the git process is running."
+        return self._proc.poll() is None
+
+    def close(self):
+        "Stop the git process."
+        if self._proc.poll() is None:
+            self._proc.stdin.close()
+            self._proc.wait()
+        self._proc.stdout.close()
+
+
 def tag_exists(repo, ref):
     """Return boolean specifying whether the reference exists in the repository.
 
@@ -113,8 +184,13 @@ def ensure_basic_git_config(workdir, repo, settings):
             )
 
 
-def clone_repo(workdir, repo, ref=None, branch=None):
-    "Check out the code."
+def clone_repo(workdir, repo, ref=None, branch=None, upstream=None):
+    """Check out the code.
+
+    The upstream is the server, or local directory, holding the
+    repositories. It defaults to opendev.org.
+
+    """
     LOG.debug('Checking out repository {} to {}'.format(
         repo, branch or ref or 'master'))
     cmd = [
@@ -125,9 +201,14 @@ def clone_repo(workdir, repo, ref=None, branch=None):
         cmd.extend(['--ref', ref])
     if branch:
         cmd.extend(['--branch', branch])
+    if upstream:
+        cmd.extend(['--upstream', upstream])
     cmd.append(repo)
-    processutils.check_call(cmd)
     dest = os.path.join(workdir, repo)
+    with _clone_locks_guard:
+        lock = _clone_locks[dest]
+    with lock:
+        processutils.check_call(cmd)
     return dest
 
 
@@ -195,6 +276,40 @@ def sha_for_tag(workdir, repo, version):
     return actual_sha
 
 
+def get_tag_shas(workdir, repo):
+    """Return a dict mapping each tag in the repo to its commit SHA.
+
+    This reads all of the tags with one git command, which is much
+    cheaper than calling sha_for_tag() for each of them.
+
+    """
+    try:
+        output = processutils.check_output(
+            ['git', 'for-each-ref',
+             # Annotated tags point to a tag object, so use the
+             # object they peel to when there is one.
+             '--format=%(refname:strip=2) %(objectname) %(*objectname)'
+             ' %(*objecttype)',
+             'refs/tags'],
+            cwd=os.path.join(workdir, repo),
+            stderr=subprocess.STDOUT,
+        ).decode('utf-8')
+    except processutils.CalledProcessError as e:
+        LOG.info('ERROR getting tags for %s: %s [%s]',
+                 repo, e, e.output.strip())
+        return {}
+    tag_shas = {}
+    for line in output.splitlines():
+        tag, sha, peeled_sha, peeled_type = line.split(' ')
+        if peeled_type == 'tag':
+            # Only one level is peeled, so let git find the commit
+            # behind a tag of another annotated tag.
+            tag_shas[tag] = sha_for_tag(workdir, repo, tag)
+        else:
+            tag_shas[tag] = peeled_sha or sha
+    return tag_shas
+
+
 def _filter_branches(output):
     "Strip garbage from branch list output"
     return [
@@ -234,77 +349,100 @@ def stable_branch_exists(workdir, repo, series):
     return branch_exists(workdir, repo, 'stable', series)
 
 
-def check_branch_sha(workdir, repo, series, sha):
+def get_branch_tips(workdir, repo):
+    """Return a dict mapping the branches in the repo to their tip SHAs.
+
+    Remote branches are named as ``git branch -a`` shows them, for
+    example ``master`` and ``remotes/origin/stable/ocata``.
+
+    """
+    try:
+        output = processutils.check_output(
+            ['git', 'for-each-ref', '--format=%(refname) %(objectname)',
+             'refs/heads', 'refs/remotes'],
+            cwd=os.path.join(workdir, repo),
+            stderr=subprocess.STDOUT,
+        ).decode('utf-8')
+    except processutils.CalledProcessError as e:
+        LOG.error('failed listing branches: %s [%s]', e, e.output.strip())
+        return {}
+    tips = {}
+    for line in output.splitlines():
+        refname, sha = line.split(' ')
+        if refname.startswith('refs/heads/'):
+            tips[refname[len('refs/heads/'):]] = sha
+        else:
+            tips[refname[len('refs/'):]] = sha
+    return tips
+
+
+def check_branch_sha(workdir, repo, series, sha, branch_tips=None):
     """Check if the SHA is in the targeted branch.
 
     The SHA must appear on a stable/$series branch (if it exists) or
-    master (if stable/$series does not exist). It is up to the
-    reviewer to verify that releases from master are in a sensible
-    location relative to other existing branches.
+    master (if stable/$series does not exist). Either the local master
+    branch or remotes/origin/master counts as master, but no other
+    remote branch does. It is up to the reviewer to verify that
+    releases from master are in a sensible location relative to other
+    existing branches.
 
     We do not compare $series against the existing branches ordering
     because that would prevent us from retroactively creating a stable
     branch for a project after a later stable branch is created (i.e.,
     if stable/N exists we could not create stable/N-1).
 
+    Callers checking several SHAs in the same repo may pass the result
+    of get_branch_tips() as branch_tips to avoid listing the branches
+    again for each one.
+
     """
     remote_match = 'remotes/origin/stable/%s' % series
-    try:
-        containing_branches = _filter_branches(
-            processutils.check_output(
-                ['git', 'branch', '-a', '--contains', sha],
-                cwd=os.path.join(workdir, repo),
-            ).decode('utf-8')
-        )
-        # If the patch is on the named branch, everything is fine.
-        if remote_match in containing_branches:
+    if branch_tips is None:
+        branch_tips = get_branch_tips(workdir, repo)
+    # Only the candidate branches need to be walked, instead of asking
+    # git for every branch containing the SHA.
+    if remote_match in branch_tips:
+        if check_ancestry(workdir, repo, sha, branch_tips[remote_match]):
+            # If the patch is on the named branch, everything is fine.
             LOG.debug('found %s branch', remote_match)
             return True
-        LOG.debug('did not find %s in branches containing %s: %s',
-                  remote_match, sha, containing_branches)
+        LOG.debug('did not find %s on %s', sha, remote_match)
+    else:
         # If the expected branch does not exist yet, this may be a
         # late release attempt to create that branch or just a project
         # that hasn't branched, yet, and is releasing from master for
         # that series. Allow the release, as long as it is on the
         # master branch.
-        all_branches = _filter_branches(
-            processutils.check_output(
-                ['git', 'branch', '-a'],
-                cwd=os.path.join(workdir, repo),
-            ).decode('utf-8')
-        )
-        if remote_match not in all_branches:
-            if 'master' in containing_branches:
-                LOG.debug('did not find %s but SHA is on master',
-                          remote_match)
-                return True
-            if 'origin/master' in containing_branches:
-                LOG.debug('did not find %s but SHA is on origin/master',
-                          remote_match)
+        for branch in ('master', 'remotes/origin/master'):
+            if (branch in branch_tips and
+                    check_ancestry(workdir, repo, sha, branch_tips[branch])):
+                LOG.debug('did not find %s but SHA is on %s',
+                          remote_match, branch)
                 return True
-        # At this point we know the release is not from the required
-        # branch and it is not from master, which means it is the
-        # wrong branch and should not be allowed.
-        LOG.debug('did not find SHA on %s or master or origin/master',
-                  remote_match)
-        return False
-    except processutils.CalledProcessError as e:
-        LOG.error('failed checking SHA on branch: %s [%s]' % (e, e.output.strip()))
-        return False
+    # At this point we know the release is not from the required
+    # branch and it is not from master, which means it is the
+    # wrong branch and should not be allowed.
+    LOG.debug('did not find SHA on %s or master or origin/master',
+              remote_match)
+    return False
 
 
 def check_ancestry(workdir, repo, old_version, sha):
     "Check if the SHA is in the ancestry of the previous version."
     try:
-        ancestors = processutils.check_output(
-            ['git', 'log', '--oneline', '--ancestry-path',
-             '%s..%s' % (old_version, sha)],
+        # This only needs to walk the commit graph, instead of listing
+        # every commit between the two versions.
+        processutils.check_call(
+            ['git', 'merge-base', '--is-ancestor', str(old_version), sha],
             cwd=os.path.join(workdir, repo),
-        ).decode('utf-8').strip()
-        return bool(ancestors)
+        )
     except processutils.CalledProcessError as e:
-        LOG.error('failed checking ancestry: %s [%s]' % (e, e.output.strip()))
+        # An exit code of 1 means it is not an ancestor, anything else
+        # is an error.
+        if e.returncode != 1:
+            LOG.error('failed checking ancestry: %s' % (e,))
         return False
+    return True
 
 
 def get_head(workdir, repo):
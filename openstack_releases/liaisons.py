@@ -14,10 +14,10 @@
 
 """Simple wrapper(s) around liaison data"""
 
-import yaml
+from openstack_releases import yamlutils
 
 
 def get_liaisons():
     with open("./data/release_liaisons.yaml", "r") as f:
-        liaison_data = yaml.safe_load(f)
+        liaison_data = yamlutils.safe_load(f)
     return liaison_data
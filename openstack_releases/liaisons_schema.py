@@ -22,4 +22,4 @@ class Schema(object):
     def __init__(self):
         self._raw = pkgutil.get_data('openstack_releases',
                                      'liaisons_schema.yaml')
-        self._data = yamlutils.loads(self._raw.decode('utf-8'))
+        self._data = yamlutils.safe_load(self._raw.decode('utf-8'))
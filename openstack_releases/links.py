@@ -12,17 +12,21 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import re
+
 import requests
-import wheel.bdist_wheel
+
+_TARBALL_SITE = 'https://tarballs.openstack.org'
+
+# Callers check many links on the same few hosts, so share one session
+# to resolve each host and open its connection only once.
+_SESSION = requests.Session()
+_SESSION.headers['user-agent'] = 'openstack-release-link-checker'
 
 
 def link_exists(url):
     try:
-        response = requests.head(
-            url,
-            headers={'user-agent': 'openstack-release-link-checker'},
-            allow_redirects=True,
-        )
+        response = _SESSION.head(url, allow_redirects=True)
         missing = (
             (response.status_code // 100 != 2) or
             'Bad object id' in response.text
@@ -37,21 +41,31 @@ def tarball_url(version, project):
     repo_base = project.repo.base_name
     base = project.tarball_base or repo_base
     return '{s}/{r}/{n}-{v}.tar.gz'.format(
-        s='https://tarballs.openstack.org',
+        s=_TARBALL_SITE,
         v=version,
         r=repo_base,
         n=base,
     )
 
 
+def _safer_name(name):
+    """Return the project name as it appears in wheel filenames.
+
+    This is the same escaping as wheel.bdist_wheel.safer_name(), which
+    is not imported because it pulls in all of setuptools.
+
+    """
+    return re.sub('[^A-Za-z0-9.]+', '_', name)
+
+
 def wheel_py3_url(version, project):
     repo_base = project.repo.base_name
     base = project.tarball_base or repo_base
     return '{s}/{r}/{n}-{v}-py3-none-any.whl'.format(
-        s='https://tarballs.openstack.org',
+        s=_TARBALL_SITE,
         v=version,
         r=repo_base,
-        n=wheel.bdist_wheel.safer_name(base),
+        n=_safer_name(base),
     )
 
 
@@ -59,10 +73,10 @@ def wheel_both_url(version, project):
     repo_base = project.repo.base_name
     base = project.tarball_base or repo_base
     return '{s}/{r}/{n}-{v}-py2.py3-none-any.whl'.format(
-        s='https://tarballs.openstack.org',
+        s=_TARBALL_SITE,
         v=version,
         r=repo_base,
-        n=wheel.bdist_wheel.safer_name(base),
+        n=_safer_name(base),
     )
 
 
@@ -42,7 +42,7 @@ def get_zuul_project_data(url=ZUUL_PROJECTS_URL):
 
     """
     r = requests.get(url)
-    raw = yamlutils.loads(r.text)
+    raw = yamlutils.safe_load(r.text)
     # Convert the raw list to a mapping from repo name to repo
     # settings, since that is how we access this most often.
     #
@@ -118,7 +118,7 @@ def read_templates_from_repo(workdir, repo_name):
             try:
                 with open(filename, 'r', encoding='utf-8') as f:
                     body = f.read()
-                results.extend(yamlutils.loads(body))
+                results.extend(yamlutils.safe_load(body))
                 LOG.debug('read {}'.format(pattern))
             except Exception as e:
                 LOG.debug('failed to read {}: {}'.format(pattern, e))
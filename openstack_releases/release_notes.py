@@ -210,7 +210,7 @@ def parse_deliverable(series, repo, deliverable_file=None):
 
     try:
         with open(deliverable_path, 'r') as d:
-            deliverable_info = yamlutils.loads(d)
+            deliverable_info = yamlutils.safe_load(d)
     except Exception:
         # TODO(smcginnis): If the deliverable doesn't match the repo name, we
         # can try to find it by loading all deliverable data and iterating on
@@ -17,8 +17,6 @@
 import logging
 import os.path
 
-import pkg_resources
-
 from openstack_releases import gitutils
 from openstack_releases import processutils
 from openstack_releases import pythonutils
@@ -90,7 +88,12 @@ def get_requirements_at_ref(workdir, repo, ref):
     body = ''
 
     try:
-        dest = gitutils.clone_repo(workdir, repo, ref=ref)
+        # Reuse an existing clone when it already has the ref, instead
+        # of fetching from the remote again for each ref we look at.
+        dest = os.path.join(workdir, repo)
+        if not (os.path.isdir(dest) and
+                gitutils.checkout_ref(workdir, repo, ref)):
+            dest = gitutils.clone_repo(workdir, repo, ref=ref)
         processutils.check_call(['python3', 'setup.py', 'sdist'], cwd=dest)
         sdist_name = pythonutils.get_sdist_name(workdir, repo)
         requirements_filename = os.path.join(
@@ -143,6 +146,10 @@ def parse_requirements(body):
     icalendar
 
     """
+    # pkg_resources is slow to import, and most of the commands that
+    # import this module never look at requirements, so load it here.
+    import pkg_resources
+
     requirements = {}
     section = ''
     for line in body.splitlines():
@@ -21,7 +21,7 @@ class Schema(object):
 
     def __init__(self):
         self._raw = pkgutil.get_data('openstack_releases', 'schema.yaml')
-        self._data = yamlutils.loads(self._raw.decode('utf-8'))
+        self._data = yamlutils.safe_load(self._raw.decode('utf-8'))
 
     @property
     def release_types(self):
@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
 import textwrap
 
 import fixtures
@@ -24,7 +25,7 @@ from openstack_releases import yamlutils
 
 class TestStableStatus(base.BaseTestCase):
 
-    _series_status_data = yamlutils.loads(textwrap.dedent('''
+    _series_status_data = yamlutils.safe_load(textwrap.dedent('''
     - name: stein
       status: future
       initial-release: 2019-04-11
@@ -84,95 +85,224 @@ class TestReleaseWasForced(base.BaseTestCase):
         self.assertTrue(r.was_forced)
 
 
-class TestEOLTags(base.BaseTestCase):
+class TestKnownRepoNames(base.BaseTestCase):
+
+    def test_from_repository_settings(self):
+        d = deliverable.Deliverable(
+            team='team',
+            series='series',
+            name='name',
+            data={
+                'repository-settings': {
+                    'openstack/release-test': {},
+                },
+                'releases': [
+                    {'version': '1.0.0',
+                     'projects': [
+                         {'repo': 'openstack/release-test',
+                          'hash': 'a' * 40},
+                         {'repo': 'openstack/other',
+                          'hash': 'b' * 40},
+                     ]},
+                ],
+            },
+        )
+        self.assertEqual(
+            frozenset(['openstack/release-test']),
+            d.known_repo_names,
+        )
+        self.assertEqual(
+            ['openstack/other', 'openstack/release-test'],
+            [r.name for r in d.repos],
+        )
+
+
+class TestGetRelease(base.BaseTestCase):
 
     def setUp(self):
         super().setUp()
-
-    def test_is_eol_tag_true(self):
-        deliverable_data = textwrap.dedent('''
-        releases:
-          - version: newton-eol
-            projects:
-              - repo: openstack/release-test
-                hash: a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5
-        ''')
-        deliv = deliverable.Deliverable(
+        self.deliv = deliverable.Deliverable(
             team='team',
-            series='newton',
+            series='series',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data={
+                'releases': [
+                    {'version': '1.0.0',
+                     'projects': [{'repo': 'openstack/release-test',
+                                   'hash': 'a' * 40}]},
+                    {'version': '1.1.0',
+                     'projects': [{'repo': 'openstack/release-test',
+                                   'hash': 'b' * 40}]},
+                    {'version': '1.0.0',
+                     'projects': [{'repo': 'openstack/release-test',
+                                   'hash': 'c' * 40}]},
+                ],
+                'branches': [
+                    {'name': 'stable/series', 'location': '1.1.0'},
+                ],
+            },
         )
-        self.assertTrue(deliv.releases[-1].is_eol)
 
-    def test_is_eol_tag_false(self):
-        deliverable_data = textwrap.dedent('''
-        releases:
-          - version: 0.3.0
-            projects:
-              - repo: openstack/release-test
-                hash: a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5
-        ''')
+    def test_found(self):
+        self.assertIs(self.deliv.releases[1], self.deliv.get_release('1.1.0'))
+
+    def test_first_duplicate(self):
+        self.assertIs(self.deliv.releases[0], self.deliv.get_release('1.0.0'))
+
+    def test_unknown(self):
+        self.assertRaises(ValueError, self.deliv.get_release, '2.0.0')
+
+    def test_branch_location(self):
+        self.assertEqual(
+            {'openstack/release-test': 'b' * 40},
+            self.deliv.branches[0].get_repo_map(),
+        )
+
+    def test_same_as_round_trip_data(self):
+        # Tests build deliverables from plain dicts as well as from the
+        # ruamel.yaml data the editing commands use.
         deliv = deliverable.Deliverable(
             team='team',
-            series='newton',
+            series='series',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.loads(yamlutils.dumps(self.deliv.data)),
+        )
+        self.assertEqual(
+            [(r.version, [p.hash for p in r.projects])
+             for r in self.deliv.releases],
+            [(r.version, [p.hash for p in r.projects])
+             for r in deliv.releases],
+        )
+        self.assertIs(deliv.releases[1], deliv.get_release('1.1.0'))
+        self.assertEqual(
+            self.deliv.branches[0].get_repo_map(),
+            deliv.branches[0].get_repo_map(),
         )
-        self.assertFalse(deliv.releases[-1].is_eol)
 
-    def test_is_eol_tag_false_typo(self):
-        deliverable_data = textwrap.dedent('''
-        releases:
-          - version: newton-dol
-            projects:
-              - repo: openstack/release-test
-                hash: a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5
-        ''')
-        deliv = deliverable.Deliverable(
+
+class TestDeliverables(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        os.mkdir(os.path.join(self.tmpdir, '_independent'))
+        with open(os.path.join(self.tmpdir, '_independent', 'name.yaml'),
+                  'w') as f:
+            f.write(textwrap.dedent('''
+            team: team
+            releases:
+              - version: 1.0.0
+                projects:
+                  - repo: openstack/name
+                    hash: {}
+            '''.format('a' * 40)))
+        self.deliverables = deliverable.Deliverables(self.tmpdir)
+
+    def test_get_deliverables(self):
+        delivs = list(self.deliverables.get_deliverables(None, None))
+        self.assertEqual(1, len(delivs))
+        self.assertEqual('team', delivs[0].team)
+        self.assertEqual('independent', delivs[0].series)
+        self.assertEqual(['1.0.0'], [r.version for r in delivs[0].releases])
+        self.assertIs(
+            delivs[0],
+            next(self.deliverables.get_deliverables('team', 'independent')),
+        )
+
+    def test_get_deliverable_history(self):
+        history = list(self.deliverables.get_deliverable_history('name'))
+        self.assertEqual(['name'], [d.name for d in history])
+        self.assertEqual('team', history[0].team)
+
+
+class TestCollapseHistory(base.BaseTestCase):
+
+    def test_collapse(self):
+        info = {
+            'releases': [
+                {'version': '1.0.0.0rc1'},
+                {'version': '1.0.0'},
+                {'version': '1.1.0.0b1'},
+                {'version': 'v0.9'},
+                {'version': 'ocata-eol'},
+            ],
+        }
+        deliverable._collapse_deliverable_history('name', info)
+        self.assertEqual(
+            ['v0.9', '1.0.0', '1.1.0.0b1', 'ocata-eol'],
+            [r['version'] for r in info['releases']],
+        )
+
+
+class TestReleaseProjects(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.deliv = deliverable.Deliverable(
             team='team',
-            series='newton',
+            series='series',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data={
+                'releases': [
+                    {'version': '1.0.0',
+                     'projects': [
+                         {'repo': 'openstack/zzz', 'hash': 'a' * 40},
+                         {'repo': 'openstack/aaa', 'hash': 'b' * 40},
+                     ]},
+                ],
+            },
         )
-        self.assertFalse(deliv.releases[-1].is_eol)
 
-    def test_eol_series_for_eol_tag(self):
-        deliverable_data = textwrap.dedent('''
-        releases:
-          - version: newton-eol
-            projects:
-              - repo: openstack/release-test
-                hash: a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5
-        ''')
+    def test_sorted(self):
+        self.assertEqual(
+            ['openstack/aaa', 'openstack/zzz'],
+            [p.repo.name for p in self.deliv.releases[0].projects],
+        )
+
+    def test_copy(self):
+        release = self.deliv.releases[0]
+        release.projects.pop()
+        self.assertEqual(2, len(release.projects))
+
+
+class TestEOLTags(base.BaseTestCase):
+
+    _deliverable_data = textwrap.dedent('''
+    releases:
+      - version: {}
+        projects:
+          - repo: openstack/release-test
+            hash: a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5
+    ''')
+
+    def _last_release(self, version):
         deliv = deliverable.Deliverable(
             team='team',
             series='newton',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(self._deliverable_data.format(version)),
         )
+        return deliv.releases[-1]
+
+    def test_is_eol_tag_true(self):
+        self.assertTrue(self._last_release('newton-eol').is_eol)
+
+    def test_is_eol_tag_false(self):
+        self.assertFalse(self._last_release('0.3.0').is_eol)
+
+    def test_is_eol_tag_false_typo(self):
+        self.assertFalse(self._last_release('newton-dol').is_eol)
+
+    def test_eol_series_for_eol_tag(self):
         self.assertEqual(
             'newton',
-            deliv.releases[-1].eol_series,
+            self._last_release('newton-eol').eol_series,
         )
 
     def test_eol_series_for_version_tag(self):
-        deliverable_data = textwrap.dedent('''
-        releases:
-          - version: 0.3.0
-            projects:
-              - repo: openstack/release-test
-                hash: a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5
-        ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='newton',
-            name='name',
-            data=yamlutils.loads(deliverable_data),
-        )
         self.assertEqual(
             '',
-            deliv.releases[-1].eol_series,
+            self._last_release('0.3.0').eol_series,
         )
 
 
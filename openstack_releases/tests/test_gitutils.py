@@ -0,0 +1,222 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import fixtures
+from oslotest import base
+
+from openstack_releases import gitutils
+from openstack_releases.tests import fixtures as or_fixtures
+
+
+class TestGetTagShas(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.workdir = self.useFixture(fixtures.TempDir()).path
+        self.repo = self.useFixture(
+            or_fixtures.GitRepoFixture(
+                self.workdir,
+                'openstack/release-test',
+            )
+        )
+        self.commit_1 = self.repo.add_file('testfile1.txt')
+        self.repo.tag('1.0.0')
+        self.commit_2 = self.repo.add_file('testfile2.txt')
+        self.repo.git('tag', '1.0.1')
+
+    def test_tags(self):
+        self.assertEqual(
+            {'1.0.0': self.commit_1, '1.0.1': self.commit_2},
+            gitutils.get_tag_shas(self.workdir, 'openstack/release-test'),
+        )
+
+    def test_matches_sha_for_tag(self):
+        tag_shas = gitutils.get_tag_shas(self.workdir,
+                                         'openstack/release-test')
+        for tag, sha in tag_shas.items():
+            self.assertEqual(
+                gitutils.sha_for_tag(self.workdir, 'openstack/release-test',
+                                     tag),
+                sha,
+            )
+
+    def test_nested_tag(self):
+        # An annotated tag of the annotated 1.0.0 tag.
+        self.repo.git('tag', '-s', '-m', 'nested tag', '1.0.2', '1.0.0')
+        tag_shas = gitutils.get_tag_shas(self.workdir,
+                                         'openstack/release-test')
+        self.assertEqual(self.commit_1, tag_shas['1.0.2'])
+        self.assertEqual(
+            gitutils.sha_for_tag(self.workdir, 'openstack/release-test',
+                                 '1.0.2'),
+            tag_shas['1.0.2'],
+        )
+
+    def test_no_tags(self):
+        self.repo.git('tag', '-d', '1.0.0', '1.0.1')
+        self.assertEqual(
+            {},
+            gitutils.get_tag_shas(self.workdir, 'openstack/release-test'),
+        )
+
+
+class TestObjectChecker(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.workdir = self.useFixture(fixtures.TempDir()).path
+        self.repo = self.useFixture(
+            or_fixtures.GitRepoFixture(
+                self.workdir,
+                'openstack/release-test',
+            )
+        )
+        self.commit_1 = self.repo.add_file('testfile1.txt')
+        self.repo.tag('1.0.0')
+        self.checker = gitutils.ObjectChecker(self.workdir,
+                                              'openstack/release-test')
+        self.addCleanup(self.checker.close)
+
+    def test_commit(self):
+        self.assertTrue(self.checker.exists(self.commit_1))
+
+    def test_tag(self):
+        self.assertTrue(self.checker.exists('1.0.0'))
+
+    def test_missing(self):
+        self.assertFalse(self.checker.exists('2.0.0'))
+        self.assertFalse(self.checker.exists('0' * 40))
+        # The process is still usable after a missing object.
+        self.assertTrue(self.checker.exists('1.0.0'))
+
+    def test_newline(self):
+        self.assertFalse(self.checker.exists('1.0.0\n1.0.0'))
+
+    def test_matches_commit_exists(self):
+        for ref in (self.commit_1, '1.0.0', '2.0.0'):
+            self.assertEqual(
+                gitutils.commit_exists(self.workdir,
+                                       'openstack/release-test', ref),
+                self.checker.exists(ref),
+            )
+
+    def test_closed(self):
+        self.assertTrue(self.checker.alive())
+        self.checker.close()
+        self.assertFalse(self.checker.alive())
+        self.assertFalse(self.checker.exists('1.0.0'))
+
+
+class TestCheckAncestry(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.workdir = self.useFixture(fixtures.TempDir()).path
+        self.repo = self.useFixture(
+            or_fixtures.GitRepoFixture(
+                self.workdir,
+                'openstack/release-test',
+            )
+        )
+        self.commit_1 = self.repo.add_file('testfile1.txt')
+        self.repo.tag('1.0.0')
+        self.commit_2 = self.repo.add_file('testfile2.txt')
+        self.repo.git('checkout', '-b', 'other', self.commit_1)
+        self.commit_3 = self.repo.add_file('testfile3.txt')
+
+    def _check(self, old_version, sha):
+        return gitutils.check_ancestry(self.workdir, 'openstack/release-test',
+                                       old_version, sha)
+
+    def test_descendant(self):
+        self.assertTrue(self._check('1.0.0', self.commit_2))
+
+    def test_not_descendant(self):
+        self.assertFalse(self._check(self.commit_2, self.commit_3))
+
+    def test_unknown_ref(self):
+        self.assertFalse(self._check('2.0.0', self.commit_2))
+
+
+class TestCheckBranchSha(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.workdir = self.useFixture(fixtures.TempDir()).path
+        self.repo = self.useFixture(
+            or_fixtures.GitRepoFixture(
+                self.workdir,
+                'openstack/release-test',
+            )
+        )
+        self.repo.git('symbolic-ref', 'HEAD', 'refs/heads/master')
+        self.commit_1 = self.repo.add_file('testfile1.txt')
+        self.commit_2 = self.repo.add_file('testfile2.txt')
+        self.repo.git('checkout', '-b', 'other', self.commit_1)
+        self.commit_3 = self.repo.add_file('testfile3.txt')
+
+    def _check(self, sha):
+        return gitutils.check_branch_sha(self.workdir,
+                                         'openstack/release-test',
+                                         'ocata', sha)
+
+    def _add_stable_branch(self, sha):
+        self.repo.git('update-ref', 'refs/remotes/origin/stable/ocata', sha)
+
+    def test_get_branch_tips(self):
+        self._add_stable_branch(self.commit_1)
+        self.assertEqual(
+            {'master': self.commit_2,
+             'other': self.commit_3,
+             'remotes/origin/stable/ocata': self.commit_1},
+            gitutils.get_branch_tips(self.workdir, 'openstack/release-test'),
+        )
+
+    def test_on_stable_branch(self):
+        self._add_stable_branch(self.commit_3)
+        self.assertTrue(self._check(self.commit_1))
+        self.assertTrue(self._check(self.commit_3))
+
+    def test_master_with_stable_branch(self):
+        self._add_stable_branch(self.commit_3)
+        self.assertFalse(self._check(self.commit_2))
+
+    def test_master_without_stable_branch(self):
+        self.assertTrue(self._check(self.commit_2))
+
+    def test_other_branch_without_stable_branch(self):
+        self.assertFalse(self._check(self.commit_3))
+
+    def test_origin_master_without_stable_branch(self):
+        # A SHA on the remote master branch is accepted, even when the
+        # local master branch does not contain it.
+        self.repo.git('update-ref', 'refs/remotes/origin/master',
+                      self.commit_3)
+        self.assertTrue(self._check(self.commit_3))
+
+    def test_other_remote_branch_without_stable_branch(self):
+        # Only master counts, not other remote branches, even when the
+        # remote HEAD points to one of them.
+        self.repo.git('update-ref', 'refs/remotes/origin/other',
+                      self.commit_3)
+        self.repo.git('symbolic-ref', 'refs/remotes/origin/HEAD',
+                      'refs/remotes/origin/other')
+        self.assertFalse(self._check(self.commit_3))
+
+    def test_branch_tips_given(self):
+        tips = {'remotes/origin/stable/ocata': self.commit_1}
+        self.assertFalse(
+            gitutils.check_branch_sha(self.workdir, 'openstack/release-test',
+                                      'ocata', self.commit_2,
+                                      branch_tips=tips))
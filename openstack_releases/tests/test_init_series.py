@@ -0,0 +1,62 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import textwrap
+from unittest import mock
+
+import fixtures
+from oslotest import base
+
+from openstack_releases.cmds import init_series
+
+
+class TestInitSeries(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.deliverables_dir = self.useFixture(fixtures.TempDir()).path
+        os.mkdir(os.path.join(self.deliverables_dir, 'ocata'))
+        with open(os.path.join(self.deliverables_dir, 'ocata',
+                               'release-test.yaml'),
+                  'w', encoding='utf-8') as f:
+            f.write(textwrap.dedent('''\
+                ---
+                launchpad: release-test
+                # NOTE: keep this comment in the copy
+                release-model: cycle-with-rc
+                team: release-management
+                type: other
+                repository-settings:
+                  openstack/release-test: {}
+                releases:
+                  - version: 1.0.0
+                    projects:
+                      - repo: openstack/release-test
+                        hash: 0cd17d1ee3b9284d36b2a0d370b49a6d2bbd9d65
+                '''))
+        self.useFixture(fixtures.MockPatch('sys.stdout'))
+
+    def test_keeps_comments(self):
+        with mock.patch('sys.argv', ['init-series', 'ocata', 'pike',
+                                     '--deliverables-dir',
+                                     self.deliverables_dir]):
+            init_series.main()
+        with open(os.path.join(self.deliverables_dir, 'pike',
+                               'release-test.yaml'),
+                  'r', encoding='utf-8') as f:
+            new_data = f.read()
+        self.assertIn('# NOTE: keep this comment in the copy', new_data)
+        self.assertIn('release-model: cycle-with-rc', new_data)
+        self.assertNotIn('releases:', new_data)
@@ -0,0 +1,75 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from oslotest import base
+import requests
+
+from openstack_releases import links
+
+
+class TestLinkExists(base.BaseTestCase):
+
+    @mock.patch.object(links._SESSION, 'head')
+    def test_exists(self, head):
+        head.return_value = mock.Mock(status_code=200, text='')
+        self.assertTrue(links.link_exists('https://example.com/a'))
+        head.assert_called_once_with('https://example.com/a',
+                                     allow_redirects=True)
+
+    @mock.patch.object(links._SESSION, 'head')
+    def test_missing(self, head):
+        head.return_value = mock.Mock(status_code=404, text='')
+        self.assertFalse(links.link_exists('https://example.com/a'))
+
+    @mock.patch.object(links._SESSION, 'head')
+    def test_bad_object(self, head):
+        head.return_value = mock.Mock(status_code=200, text='Bad object id')
+        self.assertFalse(links.link_exists('https://example.com/a'))
+
+    @mock.patch.object(links._SESSION, 'head')
+    def test_connection_error(self, head):
+        head.side_effect = requests.exceptions.ConnectionError('boom')
+        self.assertFalse(links.link_exists('https://example.com/a'))
+
+    def test_user_agent(self):
+        self.assertEqual('openstack-release-link-checker',
+                         links._SESSION.headers['user-agent'])
+
+
+class TestWheelURLs(base.BaseTestCase):
+
+    def _project(self, tarball_base=None):
+        project = mock.Mock(tarball_base=tarball_base)
+        project.repo.base_name = 'oslo.config'
+        return project
+
+    def test_py3(self):
+        self.assertEqual(
+            'https://tarballs.openstack.org/oslo.config/'
+            'oslo.config-1.0.0-py3-none-any.whl',
+            links.wheel_py3_url('1.0.0', self._project()),
+        )
+
+    def test_both(self):
+        self.assertEqual(
+            'https://tarballs.openstack.org/oslo.config/'
+            'python_novaclient-1.0.0-py2.py3-none-any.whl',
+            links.wheel_both_url(
+                '1.0.0', self._project('python-novaclient')),
+        )
+
+    def test_safer_name(self):
+        self.assertEqual('a_b.c_d', links._safer_name('a-b.c -_d'))
@@ -51,8 +51,8 @@ class TestReleaseJobsGlobal(base.BaseTestCase):
             'std',
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertEqual([], self.ctx.warnings)
+        self.assertEqual([], self.ctx.errors)
 
     def test_retired_flag(self):
         deliv = deliverable.Deliverable(
@@ -76,8 +76,8 @@ class TestReleaseJobsGlobal(base.BaseTestCase):
             'std',
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertEqual([], self.ctx.warnings)
+        self.assertEqual([], self.ctx.errors)
 
     def test_no_zuul_projects(self):
         deliv = deliverable.Deliverable(
@@ -97,7 +97,7 @@ class TestReleaseJobsGlobal(base.BaseTestCase):
             'std',
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
+        self.assertEqual([], self.ctx.warnings)
         self.assertEqual(1, len(self.ctx.errors))
 
     def test_one_expected_job(self):
@@ -125,8 +125,8 @@ class TestReleaseJobsGlobal(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertEqual([], self.ctx.warnings)
+        self.assertEqual([], self.ctx.errors)
 
     def test_two_expected_jobs(self):
         deliv = deliverable.Deliverable(
@@ -153,7 +153,7 @@ class TestReleaseJobsGlobal(base.BaseTestCase):
             'python-pypi',
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
+        self.assertEqual([], self.ctx.warnings)
         self.assertEqual(1, len(self.ctx.errors))
 
 
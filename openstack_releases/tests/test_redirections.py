@@ -48,7 +48,7 @@ class TestRedirections(base.BaseTestCase):
         team='requirements',
         series='stein',
         name='requirements',
-        data=yamlutils.loads(textwrap.dedent('''
+        data=yamlutils.safe_load(textwrap.dedent('''
         releases:
           - projects:
               - hash: not_used
@@ -61,7 +61,7 @@ class TestRedirections(base.BaseTestCase):
         team='requirements',
         series='rocky',
         name='requirements',
-        data=yamlutils.loads(textwrap.dedent('''
+        data=yamlutils.safe_load(textwrap.dedent('''
         branches:
           - name: stable/rocky
             location:
@@ -74,7 +74,7 @@ class TestRedirections(base.BaseTestCase):
         team='requirements',
         series='rocky',
         name='requirements',
-        data=yamlutils.loads(textwrap.dedent('''
+        data=yamlutils.safe_load(textwrap.dedent('''
         branches:
           - name: unstable/rocky
             location:
@@ -89,7 +89,7 @@ class TestRedirections(base.BaseTestCase):
         team='requirements',
         series='rocky',
         name='requirements',
-        data=yamlutils.loads(textwrap.dedent('''
+        data=yamlutils.safe_load(textwrap.dedent('''
         branches:
           - name: stable/rocky
             location:
@@ -106,7 +106,7 @@ class TestRedirections(base.BaseTestCase):
         team='requirements',
         series='mitaka',
         name='requirements',
-        data=yamlutils.loads(textwrap.dedent('''
+        data=yamlutils.safe_load(textwrap.dedent('''
         releases:
           - projects:
               - hash: not_used
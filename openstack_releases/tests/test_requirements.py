@@ -12,13 +12,18 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import subprocess
+import sys
 import textwrap
 from unittest import mock
 
+import fixtures
 from oslotest import base
 import pkg_resources
 
+from openstack_releases import processutils
 from openstack_releases import requirements
+from openstack_releases.tests import fixtures as or_fixtures
 
 
 class TestParseRequirements(base.BaseTestCase):
@@ -55,6 +60,17 @@ class TestParseRequirements(base.BaseTestCase):
             )
         )
 
+    def test_pkg_resources_not_imported(self):
+        # Importing the validation command should not pay for loading
+        # pkg_resources until a requirements file is parsed.
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys; '
+            'import openstack_releases.cmds.validate; '
+            'print("pkg_resources" in sys.modules)',
+        ])
+        self.assertEqual(b'False', output.strip())
+
 
 class TestGetMinSpecifier(base.BaseTestCase):
 
@@ -221,3 +237,46 @@ class TestFindBadLowerBoundsIncreases(base.BaseTestCase):
         )
         print(warnings)
         self.assertEqual(0, len(warnings))
+
+
+class TestGetRequirementsAtRef(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.workdir = self.useFixture(fixtures.TempDir()).path
+        self.repo = self.useFixture(
+            or_fixtures.GitRepoFixture(self.workdir, 'openstack/release-test')
+        )
+        self.clone_repo = self.useFixture(fixtures.MockPatch(
+            'openstack_releases.gitutils.clone_repo',
+        )).mock
+        # Skip building the sdist, but let the git commands run.
+        check_call = processutils.check_call
+        self.useFixture(fixtures.MockPatch(
+            'openstack_releases.processutils.check_call',
+            side_effect=lambda cmd, **kwargs: (
+                None if cmd[0] == 'python3' else check_call(cmd, **kwargs)
+            ),
+        ))
+        self.useFixture(fixtures.MockPatch(
+            'openstack_releases.pythonutils.get_sdist_name',
+            return_value='release-test',
+        ))
+
+    def test_existing_clone(self):
+        first = self.repo.add_file('first.txt')
+        self.repo.add_file('second.txt')
+        requirements.get_requirements_at_ref(
+            self.workdir, 'openstack/release-test', first)
+        self.clone_repo.assert_not_called()
+        self.assertEqual(
+            first,
+            self.repo.git('rev-parse', 'HEAD').decode('utf-8').strip(),
+        )
+
+    def test_unknown_ref(self):
+        self.repo.add_file('first.txt')
+        requirements.get_requirements_at_ref(
+            self.workdir, 'openstack/release-test', 'a' * 40)
+        self.clone_repo.assert_called_once_with(
+            self.workdir, 'openstack/release-test', ref='a' * 40)
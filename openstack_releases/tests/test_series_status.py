@@ -55,7 +55,7 @@ class TestConstructSeriesStatus(base.BaseTestCase):
             f.write(self._body)
 
     def test_init(self):
-        data = yamlutils.loads(self._body)
+        data = yamlutils.safe_load(self._body)
         status = series_status.SeriesStatus(data)
         self.assertIn('rocky', status)
 
@@ -64,7 +64,7 @@ class TestConstructSeriesStatus(base.BaseTestCase):
         self.assertIn('rocky', status)
 
     def test_independent_series(self):
-        data = yamlutils.loads(self._body)
+        data = yamlutils.safe_load(self._body)
         status = series_status.SeriesStatus(data)
         self.assertIn('independent', status)
 
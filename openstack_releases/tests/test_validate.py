@@ -12,22 +12,210 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import atexit
+import copy
+import io
+import logging
 import os
+import shutil
+import tempfile
 import textwrap
 from unittest import mock
 
 import fixtures
+from openstack_governance import governance
 from oslotest import base
+import testscenarios
 
 from openstack_releases.cmds import validate
 from openstack_releases import defaults
 from openstack_releases import deliverable
 from openstack_releases import gitutils
+from openstack_releases import processutils
 from openstack_releases import series_status
 from openstack_releases.tests import fixtures as or_fixtures
 from openstack_releases import yamlutils
 
 
+# Cloning the upstream repositories is the slowest part of many of
+# these tests, so clone each of them once per test process and give
+# every test its own copy. Each stestr worker is a separate process
+# with its own clone directories, so parallel workers never share one,
+# and .stestr.conf keeps the tests of a class on the same worker.
+_shared_clones = {}
+
+# Remember the clones that failed, so the other tests that need the
+# same repository fail right away instead of trying again.
+_failed_clones = {}
+
+# Keep a reference to the real function, for tests that replace
+# gitutils.clone_repo() with the shared clones.
+_real_clone_repo = gitutils.clone_repo
+
+# Each test gets its own temporary directory, which is removed when
+# the test ends, so remember the real one for the shared clones.
+_SHARED_CLONE_ROOT = tempfile.gettempdir()
+
+
+# Set OPENSTACK_RELEASES_TEST_UPSTREAM to a directory holding copies of
+# the repositories, such as openstack/release-test, to run the tests
+# without cloning from opendev.org.
+_TEST_UPSTREAM = os.environ.get('OPENSTACK_RELEASES_TEST_UPSTREAM')
+
+_OBJECTS_DIR = os.path.join(os.sep, '.git', 'objects', '')
+
+
+def _governance(team_data):
+    "Build the governance data for the teams, instead of fetching it."
+    return governance.Governance(
+        copy.deepcopy(team_data), {'Technical Committee': []}, {})
+
+
+def _link_or_copy(src, dst):
+    "Share git's object files, which never change, and copy the rest."
+    if _OBJECTS_DIR in src:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _clone_repo(workdir, repo):
+    "Copy a shared clone of the repository into the workdir."
+    if repo in _failed_clones:
+        raise RuntimeError('could not clone {}: {}'.format(
+            repo, _failed_clones[repo]))
+    if repo not in _shared_clones:
+        clone_dir = tempfile.mkdtemp(prefix='releases-test-',
+                                     dir=_SHARED_CLONE_ROOT)
+        atexit.register(shutil.rmtree, clone_dir, True)
+        try:
+            _real_clone_repo(clone_dir, repo, upstream=_TEST_UPSTREAM)
+        except Exception as err:
+            _failed_clones[repo] = err
+            raise
+        _shared_clones[repo] = clone_dir
+    # The refs and working tree are copied so each test can change
+    # them, but the objects are hard linked to save copying the
+    # history for every test.
+    shutil.copytree(
+        os.path.join(_shared_clones[repo], repo),
+        os.path.join(workdir, repo),
+        symlinks=True,
+        copy_function=_link_or_copy,
+    )
+
+
+class ValidationTestCase(base.BaseTestCase):
+    "Base class for tests that report through a ValidationContext."
+
+    def setUp(self):
+        super().setUp()
+        # assertMessageCounts shows the messages when a test fails, so
+        # there is no need to format and print the summary every time.
+        self.useFixture(fixtures.MockPatch(
+            'openstack_releases.cmds.validate.ValidationContext.show_summary',
+        ))
+        self.ctx = validate.ValidationContext()
+
+    def assertMessageCounts(self, warnings, errors):
+        # Compare both counts at once, and show the messages when they
+        # do not match.
+        self.assertEqual(
+            (warnings, errors),
+            (len(self.ctx.warnings), len(self.ctx.errors)),
+            'warnings: {}\nerrors: {}'.format(
+                self.ctx.warnings, self.ctx.errors),
+        )
+
+
+class TestCloneRepoHelper(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.source = self.useFixture(fixtures.TempDir()).path
+        self.repo = self.useFixture(
+            or_fixtures.GitRepoFixture(self.source, 'openstack/release-test')
+        )
+        self.sha = self.repo.add_file('testfile.txt')
+        self.workdir = self.useFixture(fixtures.TempDir()).path
+
+    def test_objects_shared(self):
+        with mock.patch.dict(_shared_clones,
+                             {'openstack/release-test': self.source}):
+            _clone_repo(self.workdir, 'openstack/release-test')
+        obj = os.path.join('openstack', 'release-test', '.git', 'objects',
+                           self.sha[:2], self.sha[2:])
+        self.assertTrue(os.path.samefile(
+            os.path.join(self.source, obj),
+            os.path.join(self.workdir, obj),
+        ))
+        head = os.path.join('openstack', 'release-test', '.git', 'HEAD')
+        self.assertFalse(os.path.samefile(
+            os.path.join(self.source, head),
+            os.path.join(self.workdir, head),
+        ))
+        self.assertTrue(gitutils.commit_exists(
+            self.workdir, 'openstack/release-test', self.sha))
+
+    def test_remote_branches_kept(self):
+        # The validators look for the upstream branches under
+        # remotes/origin, so the copy must keep the same refs as the
+        # shared clone instead of pointing a new origin at it.
+        self.repo.git('update-ref', 'refs/remotes/origin/stable/a', self.sha)
+        with mock.patch.dict(_shared_clones,
+                             {'openstack/release-test': self.source}):
+            _clone_repo(self.workdir, 'openstack/release-test')
+        self.assertEqual(
+            self.sha,
+            gitutils.get_branch_tips(
+                self.workdir, 'openstack/release-test',
+            ).get('remotes/origin/stable/a'),
+        )
+
+    def test_refs_not_shared(self):
+        # Tests can check out the branches of their copy and change its
+        # refs without touching the shared clone, which a worktree of
+        # the shared clone would not allow.
+        branch = self.repo.git(
+            'rev-parse', '--abbrev-ref', 'HEAD').decode('utf-8').strip()
+        with mock.patch.dict(_shared_clones,
+                             {'openstack/release-test': self.source}):
+            _clone_repo(self.workdir, 'openstack/release-test')
+        self.assertTrue(gitutils.checkout_ref(
+            self.workdir, 'openstack/release-test', branch))
+        processutils.check_call(
+            ['git', 'update-ref', 'refs/tags/copy-only', self.sha],
+            cwd=os.path.join(self.workdir, 'openstack', 'release-test'),
+        )
+        self.assertEqual(b'', self.repo.git('tag', '--list', 'copy-only'))
+
+    def test_failure_remembered(self):
+        real_clone_repo = self.useFixture(fixtures.MockPatch(
+            'openstack_releases.tests.test_validate._real_clone_repo',
+            side_effect=RuntimeError('no network'),
+        )).mock
+        with mock.patch.dict(_shared_clones, clear=True), \
+                mock.patch.dict(_failed_clones, clear=True):
+            for i in range(2):
+                self.assertRaises(RuntimeError, _clone_repo,
+                                  self.workdir, 'openstack/release-test')
+        real_clone_repo.assert_called_once_with(
+            mock.ANY, 'openstack/release-test', upstream=_TEST_UPSTREAM)
+
+    def test_local_upstream(self):
+        self.repo.git('symbolic-ref', 'HEAD', 'refs/heads/master')
+        self.useFixture(fixtures.MonkeyPatch(
+            'openstack_releases.tests.test_validate._TEST_UPSTREAM',
+            self.source))
+        with mock.patch.dict(_shared_clones, clear=True):
+            _clone_repo(self.workdir, 'openstack/release-test')
+        self.assertTrue(gitutils.commit_exists(
+            self.workdir, 'openstack/release-test', self.sha))
+
+
 class TestDecorators(base.BaseTestCase):
 
     def setUp(self):
@@ -137,11 +325,44 @@ class TestDecorators(base.BaseTestCase):
         self.assertTrue(called)
 
 
-class TestValidateBugTracker(base.BaseTestCase):
+class TestIsAHash(base.BaseTestCase):
+
+    def test_hash(self):
+        self.assertTrue(
+            validate.is_a_hash('0cd17d1ee3b9284d36b2a0d370b49a6d2bbd9d65'))
+
+    def test_mixed_case(self):
+        self.assertTrue(
+            validate.is_a_hash('0CD17D1EE3B9284D36B2A0D370B49A6D2BBD9D65'))
+
+    def test_too_short(self):
+        self.assertFalse(validate.is_a_hash('0cd17d1ee3b9'))
+
+    def test_trailing_newline(self):
+        self.assertFalse(
+            validate.is_a_hash('0cd17d1ee3b9284d36b2a0d370b49a6d2bbd9d65\n'))
+
+    def test_whitespace(self):
+        self.assertFalse(
+            validate.is_a_hash('0cd17d1ee3b9284d36b2 0d370b49a6d2bbd9d65'))
+
+    def test_not_hex(self):
+        self.assertFalse(
+            validate.is_a_hash('0cd17d1ee3b9284d36b2a0d370b49a6d2bbd9d6z'))
+
+    def test_not_a_string(self):
+        self.assertFalse(validate.is_a_hash(1.0))
+        self.assertFalse(validate.is_a_hash(10 ** 39))
+
+
+class TestValidateBugTracker(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
+        self.head = self.useFixture(fixtures.MockPatchObject(
+            validate._SESSION, 'head', autospec=True)).mock
+        self.get = self.useFixture(fixtures.MockPatchObject(
+            validate._SESSION, 'get', autospec=True)).mock
 
     def test_no_tracker(self):
         validate.validate_bugtracker(
@@ -153,12 +374,10 @@ class TestValidateBugTracker(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
-    @mock.patch('requests.get')
-    def test_launchpad_invalid_name(self, get):
-        get.return_value = mock.Mock(status_code=404)
+    def test_launchpad_invalid_name(self):
+        self.head.return_value = mock.Mock(status_code=404)
         validate.validate_bugtracker(
             deliverable.Deliverable(
                 team='team',
@@ -168,12 +387,10 @@ class TestValidateBugTracker(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
-    @mock.patch('requests.get')
-    def test_launchpad_valid_name(self, get):
-        get.return_value = mock.Mock(status_code=200)
+    def test_launchpad_valid_name(self):
+        self.head.return_value = mock.Mock(status_code=200)
         validate.validate_bugtracker(
             deliverable.Deliverable(
                 team='team',
@@ -183,13 +400,11 @@ class TestValidateBugTracker(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
-    @mock.patch('requests.get')
-    def test_launchpad_timeout(self, get):
+    def test_launchpad_timeout(self):
         import requests
-        get.side_effect = requests.exceptions.ConnectionError('testing')
+        self.head.side_effect = requests.exceptions.ConnectionError('testing')
         validate.validate_bugtracker(
             deliverable.Deliverable(
                 team='team',
@@ -199,13 +414,44 @@ class TestValidateBugTracker(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(1, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=1, errors=0)
 
-    @mock.patch('requests.get')
-    def test_storyboard_valid_id(self, get):
-        get.return_value = mock.Mock(status_code=200)
-        get.return_value.json.return_value = [
+    def test_launchpad_read_timeout(self):
+        import requests
+        self.head.side_effect = requests.exceptions.ReadTimeout('testing')
+        validate.validate_bugtracker(
+            deliverable.Deliverable(
+                team='team',
+                series=defaults.RELEASE,
+                name='name',
+                data={'launchpad': 'oslo.config'},
+            ),
+            self.ctx,
+        )
+        self.assertMessageCounts(warnings=1, errors=0)
+
+    def test_launchpad_prefetched(self):
+        self.head.return_value = mock.Mock(status_code=404)
+        self.ctx.prefetch_launchpad_status(['nonsense-name', 'nonsense-name'])
+        validate.validate_bugtracker(
+            deliverable.Deliverable(
+                team='team',
+                series=defaults.RELEASE,
+                name='name',
+                data={'launchpad': 'nonsense-name'},
+            ),
+            self.ctx,
+        )
+        self.assertMessageCounts(warnings=0, errors=1)
+        self.head.assert_called_once_with(
+            'https://api.launchpad.net/1.0/nonsense-name',
+            allow_redirects=True,
+            timeout=10,
+        )
+
+    def test_storyboard_valid_id(self):
+        self.get.return_value = mock.Mock(status_code=200)
+        self.get.return_value.json.return_value = [
             {
                 "name": "openstack-infra/storyboard",
                 "created_at": "2014-03-12T17:52:19+00:00",
@@ -236,13 +482,11 @@ class TestValidateBugTracker(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
-    @mock.patch('requests.get')
-    def test_storyboard_no_such_project(self, get):
-        get.return_value = mock.Mock(status_code=200)
-        get.return_value.json.return_value = [
+    def test_storyboard_no_such_project(self):
+        self.get.return_value = mock.Mock(status_code=200)
+        self.get.return_value.json.return_value = [
             {
                 "name": "openstack-infra/storyboard",
                 "created_at": "2014-03-12T17:52:19+00:00",
@@ -263,18 +507,35 @@ class TestValidateBugTracker(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
+    def test_storyboard_projects_fetched_once(self):
+        self.get.return_value = mock.Mock(status_code=200)
+        self.get.return_value.json.return_value = [
+            {"name": "openstack-infra/storyboard", "id": 456},
+        ]
+        for sb_id in (456, 'openstack-infra/storyboard', 760):
+            validate.validate_bugtracker(
+                deliverable.Deliverable(
+                    team='team',
+                    series=defaults.RELEASE,
+                    name='name',
+                    data={'storyboard': sb_id},
+                ),
+                self.ctx,
+            )
+        self.assertMessageCounts(warnings=0, errors=1)
+        self.get.assert_called_once_with(
+            'https://storyboard.openstack.org/api/v1/projects',
+            timeout=10,
+        )
+        self.get.return_value.json.assert_called_once_with()
 
-class TestValidateTeam(base.BaseTestCase):
 
-    def setUp(self):
-        super().setUp()
-        self.ctx = validate.ValidationContext()
+class TestValidateTeam(ValidationTestCase):
 
     def test_invalid_name(self):
-        self.ctx._team_data = {}
+        self.ctx._gov_data = _governance({})
         validate.validate_team(
             deliverable.Deliverable(
                 team='nonsense-name',
@@ -285,11 +546,10 @@ class TestValidateTeam(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(1, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=1, errors=0)
 
     def test_valid_name(self):
-        self.ctx._team_data = {'oslo': None}
+        self.ctx._gov_data = _governance({'oslo': {}})
         validate.validate_team(
             deliverable.Deliverable(
                 team='oslo',
@@ -299,15 +559,15 @@ class TestValidateTeam(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
 
-class TestValidateReleaseNotes(base.BaseTestCase):
+class TestValidateReleaseNotes(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
+        self.get = self.useFixture(fixtures.MockPatchObject(
+            validate._SESSION, 'get', autospec=True)).mock
 
     def test_no_link(self):
         validate.validate_release_notes(
@@ -319,12 +579,10 @@ class TestValidateReleaseNotes(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
-    @mock.patch('requests.get')
-    def test_invalid_link(self, get):
-        get.return_value = mock.Mock(status_code=404)
+    def test_invalid_link(self):
+        self.get.return_value = mock.Mock(status_code=404)
         validate.validate_release_notes(
             deliverable.Deliverable(
                 team='team',
@@ -336,12 +594,10 @@ class TestValidateReleaseNotes(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
-    @mock.patch('requests.get')
-    def test_valid_link(self, get):
-        get.return_value = mock.Mock(status_code=200)
+    def test_valid_link(self):
+        self.get.return_value = mock.Mock(status_code=200)
         validate.validate_release_notes(
             deliverable.Deliverable(
                 team='team',
@@ -352,12 +608,25 @@ class TestValidateReleaseNotes(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
-    @mock.patch('requests.get')
-    def test_invalid_link_multi(self, get):
-        get.return_value = mock.Mock(status_code=404)
+    def test_link_timeout(self):
+        import requests
+        self.get.side_effect = requests.exceptions.ReadTimeout('testing')
+        validate.validate_release_notes(
+            deliverable.Deliverable(
+                team='team',
+                series=defaults.RELEASE,
+                name='name',
+                data={'release-notes':
+                      'https://docs.openstack.org/releasenotes/oslo.config'},
+            ),
+            self.ctx,
+        )
+        self.assertMessageCounts(warnings=0, errors=1)
+
+    def test_invalid_link_multi(self):
+        self.get.return_value = mock.Mock(status_code=404)
         validate.validate_release_notes(
             deliverable.Deliverable(
                 team='team',
@@ -375,12 +644,10 @@ class TestValidateReleaseNotes(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
-    @mock.patch('requests.get')
-    def test_unknown_repo(self, get):
-        get.return_value = mock.Mock(status_code=200)
+    def test_unknown_repo(self):
+        self.get.return_value = mock.Mock(status_code=200)
         validate.validate_release_notes(
             deliverable.Deliverable(
                 team='team',
@@ -398,12 +665,10 @@ class TestValidateReleaseNotes(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
-    @mock.patch('requests.get')
-    def test_valid_link_multi(self, get):
-        get.return_value = mock.Mock(status_code=200)
+    def test_valid_link_multi(self):
+        self.get.return_value = mock.Mock(status_code=200)
         validate.validate_release_notes(
             deliverable.Deliverable(
                 team='team',
@@ -421,150 +686,498 @@ class TestValidateReleaseNotes(base.BaseTestCase):
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
-
-
-class TestValidateModel(base.BaseTestCase):
-
-    def setUp(self):
-        super().setUp()
-        self.ctx = validate.ValidationContext()
-
-    def test_no_model_series(self):
-        validate.validate_model(
+        self.assertMessageCounts(warnings=0, errors=0)
+
+    def test_many_links_reported_in_order(self):
+        def fake_get(link, timeout):
+            if 'missing' in link:
+                return mock.Mock(status_code=404)
+            return mock.Mock(status_code=200)
+        self.get.side_effect = fake_get
+        repos = ['openstack/repo%d' % i for i in range(10)]
+        links = {
+            repo: 'https://docs.openstack.org/{}/{}'.format(
+                repo, 'missing' if i % 3 == 0 else 'found')
+            for i, repo in enumerate(repos)
+        }
+        validate.validate_release_notes(
             deliverable.Deliverable(
                 team='team',
-                series='ocata',
+                series=defaults.RELEASE,
                 name='name',
-                data={},
+                data={
+                    'repository-settings': {repo: {} for repo in repos},
+                    'release-notes': links,
+                },
             ),
             self.ctx,
         )
-        self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
-
-    def test_no_model_independent(self):
+        self.assertEqual([], self.ctx.warnings)
+        self.assertEqual(
+            [links[repos[i]] for i in (0, 3, 6, 9)],
+            [e.split()[-2].rstrip(':') for e in self.ctx.errors],
+        )
+
+
+class TestValidateModel(testscenarios.WithScenarios, ValidationTestCase):
+
+    scenarios = [
+        ('no_model_series',
+         {'series': 'ocata', 'data': {}, 'errors': 1}),
+        ('no_model_independent',
+         {'series': 'independent', 'data': {}, 'errors': 0}),
+        ('with_model_independent_match',
+         {'series': 'independent',
+          'data': {'release-model': 'independent'},
+          'errors': 0}),
+        ('with_model_independent_nomatch',
+         {'series': 'independent',
+          'data': {'release-model': 'cycle-with-intermediary'},
+          'errors': 1}),
+        ('with_model_abandoned_match',
+         {'series': 'independent',
+          'data': {'release-model': 'abandoned'},
+          'errors': 0}),
+        ('with_model_abandoned_nomatch',
+         {'series': 'ocata',
+          'data': {'release-model': 'abandoned'},
+          'errors': 1}),
+        ('with_independent_and_model',
+         {'series': 'ocata',
+          'data': {'release-model': 'independent'},
+          'errors': 1}),
+        ('with_model_series',
+         {'series': 'ocata',
+          'data': {'release-model': 'cycle-with-intermediary'},
+          'errors': 0}),
+        ('untagged_with_releases',
+         {'series': 'ocata',
+          'data': {
+              'release-model': 'untagged',
+              'artifact-link-mode': 'none',
+              'releases': [
+                  {'version': '99.5.0',
+                   'projects': [
+                       {'repo': 'openstack/release-test',
+                        'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
+                   ]},
+              ],
+          },
+          'errors': 1}),
+    ]
+
+    def test_model(self):
         validate.validate_model(
             deliverable.Deliverable(
                 team='team',
-                series='independent',
+                series=self.series,
                 name='name',
-                data={},
+                data=self.data,
             ),
             self.ctx,
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=self.errors)
 
-    def test_with_model_independent_match(self):
-        validate.validate_model(
+
+class TestPrefetchRepositories(ValidationTestCase):
+
+    @mock.patch('openstack_releases.gitutils.clone_repo')
+    def test_unique_active_repos(self, clone_repo):
+        delivs = [
             deliverable.Deliverable(
                 team='team',
-                series='independent',
+                series=defaults.RELEASE,
                 name='name',
-                data={'release-model': 'independent'},
+                data={
+                    'repository-settings': {
+                        'openstack/release-test': {},
+                        'openstack/retired-repo': {'flags': ['retired']},
+                    },
+                },
             ),
-            self.ctx,
-        )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
-
-    def test_with_model_independent_nomatch(self):
-        validate.validate_model(
             deliverable.Deliverable(
                 team='team',
-                series='independent',
-                name='name',
-                data={'release-model': 'cycle-with-intermediary'},
+                series=defaults.RELEASE,
+                name='other',
+                data={
+                    'repository-settings': {
+                        'openstack/release-test': {},
+                        'openstack/releases': {},
+                    },
+                },
             ),
-            self.ctx,
+        ]
+        validate.prefetch_repositories(delivs, self.ctx)
+        self.assertEqual(
+            [mock.call(self.ctx.workdir, 'openstack/release-test', 'master'),
+             mock.call(self.ctx.workdir, 'openstack/releases', 'master')],
+            sorted(clone_repo.mock_calls),
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
 
-    def test_with_model_abandoned_match(self):
-        validate.validate_model(
-            deliverable.Deliverable(
-                team='team',
-                series='independent',
-                name='name',
-                data={'release-model': 'abandoned'},
-            ),
-            self.ctx,
+    @mock.patch('openstack_releases.gitutils.clone_repo')
+    def test_failures_not_reported(self, clone_repo):
+        clone_repo.side_effect = RuntimeError('testing')
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='name',
+            data={
+                'repository-settings': {
+                    'openstack/release-test': {},
+                },
+            },
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        validate.prefetch_repositories([deliv], self.ctx)
+        self.assertMessageCounts(warnings=0, errors=0)
+        self.assertEqual(set(), self.ctx.fetched_repos)
 
-    def test_with_model_abandoned_nomatch(self):
-        validate.validate_model(
-            deliverable.Deliverable(
-                team='team',
-                series='ocata',
-                name='name',
-                data={'release-model': 'abandoned'},
-            ),
-            self.ctx,
+    @mock.patch('openstack_releases.gitutils.clone_repo')
+    def test_fetched_repos(self, clone_repo):
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='name',
+            data={
+                'repository-settings': {
+                    'openstack/release-test': {},
+                },
+            },
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        validate.prefetch_repositories([deliv], self.ctx)
+        self.assertEqual({'openstack/release-test'}, self.ctx.fetched_repos)
 
-    def test_with_independent_and_model(self):
-        validate.validate_model(
-            deliverable.Deliverable(
-                team='team',
-                series='ocata',
-                name='name',
-                data={'release-model': 'independent'},
-            ),
-            self.ctx,
+
+class TestCloneDeliverable(ValidationTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.safe_clone_repo = self.useFixture(fixtures.MockPatch(
+            'openstack_releases.gitutils.safe_clone_repo',
+            return_value=True,
+        )).mock
+        self.checkout_ref = self.useFixture(fixtures.MockPatch(
+            'openstack_releases.gitutils.checkout_ref',
+            return_value=True,
+        )).mock
+        self.deliv = deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='name',
+            data={
+                'repository-settings': {
+                    'openstack/release-test': {},
+                    'openstack/releases': {},
+                },
+            },
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
 
-    def test_with_model_series(self):
-        validate.validate_model(
-            deliverable.Deliverable(
-                team='team',
-                series='ocata',
-                name='name',
-                data={'release-model': 'cycle-with-intermediary'},
-            ),
-            self.ctx,
+    def test_fetch_once(self):
+        for i in range(2):
+            self.assertTrue(
+                validate.clone_deliverable(self.deliv, self.ctx))
+        self.assertEqual(2, self.safe_clone_repo.call_count)
+        self.assertEqual(2, self.checkout_ref.call_count)
+
+    def test_prefetched(self):
+        self.ctx.fetched_repos.add('openstack/release-test')
+        self.assertTrue(validate.clone_deliverable(self.deliv, self.ctx))
+        self.safe_clone_repo.assert_called_once_with(
+            self.ctx.workdir, 'openstack/releases', 'master', self.ctx)
+        self.checkout_ref.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test', 'master', self.ctx)
+
+    def test_failed_clone_not_recorded(self):
+        self.safe_clone_repo.return_value = False
+        self.assertFalse(validate.clone_deliverable(self.deliv, self.ctx))
+        self.assertEqual(set(), self.ctx.fetched_repos)
+
+
+class TestMapProjects(base.BaseTestCase):
+
+    def test_preserves_order(self):
+        projects = list(range(20))
+        self.assertEqual(
+            [p * 2 for p in projects],
+            validate.map_projects(lambda p: p * 2, projects),
+        )
+
+    def test_empty(self):
+        self.assertEqual([], validate.map_projects(self.fail, []))
+
+
+class TestBufferedOutput(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.stdout = io.StringIO()
+        self.useFixture(fixtures.MonkeyPatch('sys.stdout', self.stdout))
+        self.handler = logging.StreamHandler(self.stdout)
+        root = logging.getLogger()
+        root.addHandler(self.handler)
+        self.addCleanup(root.removeHandler, self.handler)
+
+    def test_written_at_end(self):
+        with validate.buffered_output():
+            print('one')
+            validate.LOG.error('two')
+            print('three')
+            self.assertEqual('', self.stdout.getvalue())
+        self.assertEqual('one\ntwo\nthree\n', self.stdout.getvalue())
+        self.assertIs(self.stdout, self.handler.stream)
+
+    def test_written_on_error(self):
+        def fail():
+            with validate.buffered_output():
+                print('one')
+                raise RuntimeError('testing')
+        self.assertRaises(RuntimeError, fail)
+        self.assertEqual('one\n', self.stdout.getvalue())
+        self.assertIs(self.stdout, self.handler.stream)
+
+
+class TestShowSummary(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.stdout = io.StringIO()
+        self.useFixture(fixtures.MonkeyPatch('sys.stdout', self.stdout))
+        self.ctx = validate.ValidationContext()
+
+    def test_messages(self):
+        self.ctx.set_filename('a.yaml')
+        self.ctx.warning('w1')
+        self.ctx.error('e1')
+        self.ctx.error('e2')
+        self.ctx.show_summary()
+        self.assertEqual(
+            '\nSummary\n-------\n'
+            '\n\n1 warnings found\n'
+            'a.yaml: unknown: w1\n'
+            '\n\n2 errors found\n'
+            'a.yaml: unknown: e1\n'
+            'a.yaml: unknown: e2\n',
+            self.stdout.getvalue(),
+        )
+
+    def test_no_messages(self):
+        self.ctx.show_summary()
+        self.assertEqual(
+            '\nSummary\n-------\n'
+            '\n\n0 warnings found\n'
+            '\n\n0 errors found\n',
+            self.stdout.getvalue(),
+        )
+
+
+class TestCachedGitQuery(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.ctx = validate.ValidationContext()
+
+    @mock.patch('openstack_releases.gitutils.ObjectChecker')
+    def test_commit_exists_cached(self, checker):
+        exists = checker.return_value.exists
+        exists.return_value = True
+        for i in range(2):
+            self.assertTrue(validate._commit_exists(
+                self.ctx.workdir, 'openstack/release-test', '0.1.0'))
+        exists.assert_called_once_with('0.1.0')
+
+    @mock.patch('openstack_releases.gitutils.ObjectChecker')
+    def test_one_checker_per_repo(self, checker):
+        for ref in ('0.1.0', '0.2.0'):
+            validate._commit_exists(
+                self.ctx.workdir, 'openstack/release-test', ref)
+        checker.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test')
+        self.assertEqual(2, checker.return_value.exists.call_count)
+
+    @mock.patch('openstack_releases.gitutils.commit_exists')
+    @mock.patch('openstack_releases.gitutils.ObjectChecker')
+    def test_dead_checker_replaced(self, checker, commit_exists):
+        dead = mock.Mock()
+        dead.alive.return_value = False
+        dead.exists.return_value = False
+        live = mock.Mock()
+        live.alive.return_value = True
+        live.exists.return_value = True
+        checker.side_effect = [dead, live]
+        commit_exists.return_value = True
+        # The answer of the dead process is replaced by asking git.
+        self.assertTrue(validate._commit_exists(
+            self.ctx.workdir, 'openstack/release-test', '0.1.0'))
+        commit_exists.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test', '0.1.0')
+        # The next query gets a new checker.
+        self.assertTrue(validate._commit_exists(
+            self.ctx.workdir, 'openstack/release-test', '0.2.0'))
+        dead.close.assert_called_once_with()
+        live.exists.assert_called_once_with('0.2.0')
+        self.assertEqual(1, commit_exists.call_count)
+
+    @mock.patch('openstack_releases.pythonutils.get_sdist_name')
+    def test_sdist_name_cached_per_commit(self, get_sdist_name):
+        get_sdist_name.return_value = 'release-test'
+        repo = self.useFixture(
+            or_fixtures.GitRepoFixture(
+                self.ctx.workdir,
+                'openstack/release-test',
+            )
         )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        repo.add_file('setup.py')
+        for i in range(2):
+            self.assertEqual('release-test', validate._get_sdist_name(
+                self.ctx.workdir, 'openstack/release-test'))
+        self.assertEqual(1, get_sdist_name.call_count)
+        repo.add_file('setup.cfg')
+        validate._get_sdist_name(self.ctx.workdir, 'openstack/release-test')
+        self.assertEqual(2, get_sdist_name.call_count)
 
-    def test_untagged_with_releases(self):
+    @mock.patch('openstack_releases.pythonutils.get_sdist_name')
+    def test_sdist_name_not_python(self, get_sdist_name):
+        get_sdist_name.return_value = None
+        for i in range(2):
+            self.assertIsNone(validate._get_sdist_name(
+                self.ctx.workdir, 'openstack/release-test'))
+        self.assertEqual(2, get_sdist_name.call_count)
+
+    @mock.patch('openstack_releases.gitutils.ObjectChecker')
+    def test_includes_new_tag_keyed_by_workdir(self, checker):
+        checker.return_value.exists.side_effect = [True, False]
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='name',
+            data={
+                'releases': [
+                    {'version': '0.1.0',
+                     'projects': [{'repo': 'openstack/release-test',
+                                   'hash': 'a' * 40}]},
+                ],
+            },
+        )
+        other = validate.ValidationContext()
+        self.assertFalse(validate.includes_new_tag(deliv, self.ctx))
+        self.assertTrue(validate.includes_new_tag(deliv, other))
+
+    @mock.patch('openstack_releases.gitutils.branches_containing')
+    @mock.patch('openstack_releases.gitutils.get_branch_tips')
+    def test_branch_points_list_branches_once(self, get_branch_tips,
+                                              branches_containing):
+        get_branch_tips.return_value = {
+            'master': 'a' * 40,
+            'remotes/origin/stable/newton': 'b' * 40,
+        }
+        branches_containing.return_value = ['origin/master']
         deliv = deliverable.Deliverable(
             team='team',
             series='ocata',
             name='name',
             data={
-                'release-model': 'untagged',
-                'artifact-link-mode': 'none',
                 'releases': [
-                    {'version': '99.5.0',
-                     'projects': [
-                         {'repo': 'openstack/release-test',
-                          'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
-                     ]},
-                ]
-            }
+                    {'version': '0.1.0',
+                     'projects': [{'repo': 'openstack/release-test',
+                                   'hash': 'a' * 40}]},
+                ],
+                'branches': [
+                    {'name': 'stable/newton', 'location': '0.1.0'},
+                    {'name': 'stable/ocata', 'location': '0.1.0'},
+                ],
+            },
         )
-        validate.validate_model(deliv, self.ctx)
-        self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
+        validate.validate_branch_points(deliv, self.ctx)
+        get_branch_tips.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test')
+        # Both branches start from the same commit.
+        branches_containing.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test', 'a' * 40)
+        # stable/newton exists without containing the branch point, and
+        # stable/ocata does not exist yet.
         self.assertEqual(1, len(self.ctx.errors))
 
-
-class TestValidateNotAbandoned(base.BaseTestCase):
+    @mock.patch('openstack_releases.gitutils.get_tag_shas')
+    @mock.patch('openstack_releases.gitutils.sha_for_tag')
+    def test_sha_for_tag_keyed_by_workdir(self, sha_for_tag, get_tag_shas):
+        get_tag_shas.return_value = {}
+        sha_for_tag.return_value = ''
+        other = validate.ValidationContext()
+        for ctx in (self.ctx, other, self.ctx):
+            validate._sha_for_tag(ctx.workdir, 'openstack/release-test',
+                                  '0.1.0')
+        self.assertEqual(2, sha_for_tag.call_count)
+        self.assertEqual(2, get_tag_shas.call_count)
+
+    @mock.patch('openstack_releases.gitutils.get_tag_shas')
+    @mock.patch('openstack_releases.gitutils.sha_for_tag')
+    def test_sha_for_tag_from_tag_list(self, sha_for_tag, get_tag_shas):
+        get_tag_shas.return_value = {'0.1.0': 'a' * 40}
+        for version in ('0.1.0', '0.2.0'):
+            validate._sha_for_tag(self.ctx.workdir, 'openstack/release-test',
+                                  version)
+        get_tag_shas.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test')
+        sha_for_tag.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test', '0.2.0')
+
+    @mock.patch('openstack_releases.gitutils.get_branch_tips')
+    @mock.patch('openstack_releases.gitutils.check_branch_sha')
+    def test_check_branch_sha_cached(self, check_branch_sha, get_branch_tips):
+        check_branch_sha.return_value = True
+        get_branch_tips.return_value = {'master': 'b' * 40}
+        for sha in ('a' * 40, 'a' * 40, 'c' * 40):
+            self.assertTrue(validate._check_branch_sha(
+                self.ctx.workdir, 'openstack/release-test', 'ocata', sha))
+        self.assertEqual(
+            [mock.call(self.ctx.workdir, 'openstack/release-test', 'ocata',
+                       sha, branch_tips={'master': 'b' * 40})
+             for sha in ('a' * 40, 'c' * 40)],
+            check_branch_sha.mock_calls,
+        )
+        get_branch_tips.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test')
+
+    @mock.patch('openstack_releases.gitutils.ObjectChecker')
+    def test_discarded_context_released(self, checker):
+        ctx = validate.ValidationContext()
+        workdir = ctx.workdir
+        validate._commit_exists(workdir, 'openstack/release-test', '0.1.0')
+        del ctx
+        checker.return_value.close.assert_called_once_with()
+        self.assertFalse(os.path.exists(workdir))
+        self.assertNotIn(('commit_exists', workdir,
+                          'openstack/release-test', '0.1.0'),
+                         validate._git_query_cache)
+
+    def test_workdir_root(self):
+        root = self.useFixture(fixtures.TempDir()).path
+        ctx = validate.ValidationContext(workdir_root=root)
+        self.assertEqual(root, os.path.dirname(ctx.workdir))
+        workdir = ctx.workdir
+        del ctx
+        self.assertEqual([], os.listdir(root))
+        self.assertFalse(os.path.exists(workdir))
+
+    def test_contexts_independent(self):
+        # Tests rely on a new context starting from a clean state, with
+        # nothing left over from the repositories or files that another
+        # context has seen.
+        first = validate.ValidationContext()
+        first.error('testing')
+        first.fetched_repos.add('openstack/release-test')
+        first.add_deliverables({'a.yaml': mock.sentinel.deliv})
+        second = validate.ValidationContext()
+        self.assertNotEqual(first.workdir, second.workdir)
+        self.assertEqual([], second.errors)
+        self.assertEqual(set(), second.fetched_repos)
+        self.assertNotIn('a.yaml', second._deliverables)
+
+
+class TestValidateNotAbandoned(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/release-test')
+        _clone_repo(self.ctx.workdir, 'openstack/release-test')
 
     def test_new_release_on_abandoned_deliverable(self):
         deliv = deliverable.Deliverable(
@@ -587,15 +1200,58 @@ class TestValidateNotAbandoned(base.BaseTestCase):
         )
         validate.validate_deliverable_is_not_abandoned(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidateReleaseSHAExists(base.BaseTestCase):
+class TestValidateReleaseHashes(ValidationTestCase):
+
+    def _make_deliv(self, hash, repo='openstack/release-test'):
+        return deliverable.Deliverable(
+            team='team',
+            series='ocata',
+            name='name',
+            data={
+                'artifact-link-mode': 'none',
+                'releases': [
+                    {'version': '0.1',
+                     'projects': [
+                         {'repo': repo,
+                          'hash': hash,
+                          'tarball-base': 'openstack-release-test'},
+                     ]}
+                ],
+                'repository-settings': {
+                    'openstack/retired-repo': {'flags': ['retired']},
+                },
+            },
+        )
+
+    def test_invalid_hash(self):
+        validate.validate_release_hashes(
+            self._make_deliv('this-is-not-a-hash'), self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=1)
+
+    def test_valid_hash(self):
+        validate.validate_release_hashes(
+            self._make_deliv('0cd17d1ee3b9284d36b2a0d370b49a6d2bbd9d65'),
+            self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=0)
+
+    def test_retired_repo(self):
+        validate.validate_release_hashes(
+            self._make_deliv('this-is-not-a-hash',
+                             repo='openstack/retired-repo'),
+            self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=0)
+
+
+class TestValidateReleaseSHAExists(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
         self._make_repo()
 
     def _make_repo(self):
@@ -626,8 +1282,7 @@ class TestValidateReleaseSHAExists(base.BaseTestCase):
         )
         validate.validate_release_sha_exists(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_valid_hash(self):
         deliv = deliverable.Deliverable(
@@ -648,8 +1303,7 @@ class TestValidateReleaseSHAExists(base.BaseTestCase):
         )
         validate.validate_release_sha_exists(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_no_such_hash(self):
         deliv = deliverable.Deliverable(
@@ -670,8 +1324,7 @@ class TestValidateReleaseSHAExists(base.BaseTestCase):
         )
         validate.validate_release_sha_exists(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_no_releases(self):
         # When we initialize a new series, we won't have any release
@@ -687,15 +1340,13 @@ class TestValidateReleaseSHAExists(base.BaseTestCase):
         )
         validate.validate_release_sha_exists(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
 
-class TestValidateExistingTags(base.BaseTestCase):
+class TestValidateExistingTags(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
         self._make_repo()
 
     def _make_repo(self):
@@ -729,8 +1380,7 @@ class TestValidateExistingTags(base.BaseTestCase):
         )
         validate.validate_existing_tags(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_mismatch(self):
         deliv = deliverable.Deliverable(
@@ -750,8 +1400,7 @@ class TestValidateExistingTags(base.BaseTestCase):
         )
         validate.validate_existing_tags(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_no_releases(self):
         # When we initialize a new series, we won't have any release
@@ -767,16 +1416,81 @@ class TestValidateExistingTags(base.BaseTestCase):
         )
         validate.validate_existing_tags(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
 
-class TestValidateReleaseBranchMembership(base.BaseTestCase):
+class TestValidateReleaseBranchMembershipRetag(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/release-test')
+        self.repo = self.useFixture(
+            or_fixtures.GitRepoFixture(
+                self.ctx.workdir,
+                'openstack/release-test',
+            )
+        )
+        self.commit_1 = self.repo.add_file('testfile.txt')
+        self.repo.tag('1.0.0')
+        self.useFixture(fixtures.MockPatch(
+            'openstack_releases.gitutils.check_branch_sha',
+            return_value=True,
+        ))
+        self.check_ancestry = self.useFixture(fixtures.MockPatch(
+            'openstack_releases.gitutils.check_ancestry',
+        )).mock
+
+    def _make_deliv(self, new_hash):
+        return deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='name',
+            data={
+                'artifact-link-mode': 'none',
+                'releases': [
+                    {'version': '1.0.0',
+                     'projects': [
+                         {'repo': 'openstack/release-test',
+                          'hash': self.commit_1},
+                     ]},
+                    {'version': '1.0.1',
+                     'projects': [
+                         {'repo': 'openstack/release-test',
+                          'hash': new_hash},
+                     ]},
+                ],
+            },
+        )
+
+    def test_retag_skips_ancestry(self):
+        validate.validate_release_branch_membership(
+            self._make_deliv(self.commit_1), self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=0)
+        self.check_ancestry.assert_not_called()
+
+    def test_retag_upper_case_hash(self):
+        validate.validate_release_branch_membership(
+            self._make_deliv(self.commit_1.upper()), self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=0)
+        self.check_ancestry.assert_not_called()
+
+    def test_new_commit_checks_ancestry(self):
+        commit_2 = self.repo.add_file('testfile2.txt')
+        self.check_ancestry.return_value = True
+        validate.validate_release_branch_membership(
+            self._make_deliv(commit_2), self.ctx)
+        self.ctx.show_summary()
+        self.assertEqual([], self.ctx.errors)
+        self.check_ancestry.assert_called_once_with(
+            self.ctx.workdir, 'openstack/release-test', '1.0.0', commit_2)
+
+
+class TestValidateReleaseBranchMembership(ValidationTestCase):
+
+    def setUp(self):
+        super().setUp()
+        _clone_repo(self.ctx.workdir, 'openstack/release-test')
 
     def test_hash_from_master_used_in_stable_release(self):
         deliv = deliverable.Deliverable(
@@ -798,8 +1512,7 @@ class TestValidateReleaseBranchMembership(base.BaseTestCase):
         )
         validate.validate_release_branch_membership(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_hash_from_master_used_in_stable_release2(self):
         deliv = deliverable.Deliverable(
@@ -827,8 +1540,7 @@ class TestValidateReleaseBranchMembership(base.BaseTestCase):
         )
         validate.validate_release_branch_membership(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_hash_from_stable_used_in_master_release(self):
         deliv = deliverable.Deliverable(
@@ -850,11 +1562,10 @@ class TestValidateReleaseBranchMembership(base.BaseTestCase):
         )
         validate.validate_release_branch_membership(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_hash_from_master_used_after_default_branch_should_exist_but_does_not(self):
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/releases')
+        _clone_repo(self.ctx.workdir, 'openstack/releases')
         deliv = deliverable.Deliverable(
             team='team',
             series='austin',
@@ -872,8 +1583,7 @@ class TestValidateReleaseBranchMembership(base.BaseTestCase):
         )
         validate.validate_release_branch_membership(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_not_descendent(self):
         deliv = deliverable.Deliverable(
@@ -902,8 +1612,7 @@ class TestValidateReleaseBranchMembership(base.BaseTestCase):
         )
         validate.validate_release_branch_membership(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(2, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=2)
 
     def test_no_releases(self):
         # When we initialize a new series, we won't have any release
@@ -919,16 +1628,14 @@ class TestValidateReleaseBranchMembership(base.BaseTestCase):
         )
         validate.validate_release_branch_membership(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
 
-class TestValidateNewReleasesAtEnd(base.BaseTestCase):
+class TestValidateNewReleasesAtEnd(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/release-test')
+        _clone_repo(self.ctx.workdir, 'openstack/release-test')
 
     def test_no_releases(self):
         # When we initialize a new series, we won't have any release
@@ -944,8 +1651,7 @@ class TestValidateNewReleasesAtEnd(base.BaseTestCase):
         )
         validate.validate_new_releases_at_end(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_not_at_end(self):
         deliv = deliverable.Deliverable(
@@ -972,13 +1678,12 @@ class TestValidateNewReleasesAtEnd(base.BaseTestCase):
         )
         validate.validate_new_releases_at_end(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
+class TestValidateNewReleasesInOpenSeries(ValidationTestCase):
 
-    _series_status_data = yamlutils.loads(textwrap.dedent('''
+    _series_status_data = yamlutils.safe_load(textwrap.dedent('''
     - name: rocky
       status: development
       initial-release: 2018-08-30
@@ -996,8 +1701,7 @@ class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/release-test')
+        _clone_repo(self.ctx.workdir, 'openstack/release-test')
         self.series_status = series_status.SeriesStatus(
             self._series_status_data)
         self.useFixture(fixtures.MockPatch(
@@ -1019,8 +1723,7 @@ class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
         )
         validate.validate_new_releases_in_open_series(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_development(self):
         deliv = deliverable.Deliverable(
@@ -1041,8 +1744,7 @@ class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
         )
         validate.validate_new_releases_in_open_series(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_maintained(self):
         deliv = deliverable.Deliverable(
@@ -1063,8 +1765,7 @@ class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
         )
         validate.validate_new_releases_in_open_series(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_extended_maintaintenance(self):
         deliv = deliverable.Deliverable(
@@ -1085,8 +1786,7 @@ class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
         )
         validate.validate_new_releases_in_open_series(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_end_of_life(self):
         deliv = deliverable.Deliverable(
@@ -1107,8 +1807,7 @@ class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
         )
         validate.validate_new_releases_in_open_series(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_eol_in_end_of_life(self):
         deliv = deliverable.Deliverable(
@@ -1129,8 +1828,7 @@ class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
         )
         validate.validate_new_releases_in_open_series(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_em_in_end_of_life(self):
         deliv = deliverable.Deliverable(
@@ -1151,16 +1849,14 @@ class TestValidateNewReleasesInOpenSeries(base.BaseTestCase):
         )
         validate.validate_new_releases_in_open_series(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
 
-class TestValidateVersionNumbers(base.BaseTestCase):
+class TestValidateVersionNumbers(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/release-test')
+        _clone_repo(self.ctx.workdir, 'openstack/release-test')
 
     @mock.patch('openstack_releases.versionutils.validate_version')
     def test_invalid_version(self, validate_version):
@@ -1187,8 +1883,7 @@ class TestValidateVersionNumbers(base.BaseTestCase):
         )
         validate.validate_version_numbers(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     @mock.patch('openstack_releases.requirements.find_bad_lower_bound_increases')
     def test_generic_model(self, mock_lower_bound):
@@ -1214,8 +1909,7 @@ class TestValidateVersionNumbers(base.BaseTestCase):
         )
         validate.validate_version_numbers(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
         self.assertFalse(mock_lower_bound.called)
 
     def test_valid_version(self):
@@ -1236,8 +1930,7 @@ class TestValidateVersionNumbers(base.BaseTestCase):
         )
         validate.validate_version_numbers(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_eol_valid_version(self):
         deliv = deliverable.Deliverable(
@@ -1253,318 +1946,212 @@ class TestValidateVersionNumbers(base.BaseTestCase):
                           'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
                      ]}
                 ],
-            }
-        )
-        validate.validate_version_numbers(deliv, self.ctx)
-        self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
-
-    def test_em_valid_version(self):
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='name',
-            data={
-                'artifact-link-mode': 'none',
-                'releases': [
-                    {'version': 'ocata-em',
-                     'projects': [
-                         {'repo': 'openstack/release-test',
-                          'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
-                     ]}
-                ],
-            }
-        )
-        validate.validate_version_numbers(deliv, self.ctx)
-        self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
-
-    def test_eol_wrong_branch(self):
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='name',
-            data={
-                'artifact-link-mode': 'none',
-                'releases': [
-                    {'version': 'newton-eol',
-                     'projects': [
-                         {'repo': 'openstack/release-test',
-                          'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
-                     ]}
-                ],
-            }
-        )
-        validate.validate_version_numbers(deliv, self.ctx)
-        self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
-
-    def test_em_wrong_branch(self):
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='name',
-            data={
-                'artifact-link-mode': 'none',
-                'releases': [
-                    {'version': 'newton-em',
-                     'projects': [
-                         {'repo': 'openstack/release-test',
-                          'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
-                     ]}
-                ],
-            }
-        )
-        validate.validate_version_numbers(deliv, self.ctx)
-        self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
-
-    def test_no_releases(self):
-        # When we initialize a new series, we won't have any release
-        # data. That's OK.
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='name',
-            data={
-                'artifact-link-mode': 'none',
-                'releases': []
-            }
-        )
-        validate.validate_version_numbers(deliv, self.ctx)
-        self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
-
-
-class TestGetReleaseType(base.BaseTestCase):
-
-    def setUp(self):
-        super().setUp()
-        self.tmpdir = self.useFixture(fixtures.TempDir()).path
-        self.ctx = validate.ValidationContext()
-
-    def test_explicit(self):
-        deliv = deliverable.Deliverable(
-            team='team',
-            series=defaults.RELEASE,
-            name='name',
-            data={
-                'artifact-link-mode': 'none',
-                'release-type': 'explicitly-set',
-                'releases': [
-                    {'version': '99.1.0',
-                     'projects': [
-                         {'repo': 'openstack/puppet-watcher',
-                          'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
-                     ]}
-                ],
-            },
-        )
-        release_type, explicit = validate.get_release_type(
-            deliv,
-            deliv.releases[0].projects[0].repo,
-            self.tmpdir,
-        )
-        self.assertEqual(('explicitly-set', True), (release_type, explicit))
-
-    def test_library(self):
-        deliv = deliverable.Deliverable(
-            team='team',
-            series=defaults.RELEASE,
-            name='name',
-            data={
-                'artifact-link-mode': 'none',
-                'type': 'library',
-                'releases': [
-                    {'version': '99.1.0',
-                     'projects': [
-                         {'repo': 'openstack/puppet-watcher',
-                          'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
-                     ]}
-                ],
-            },
-        )
-        release_type, explicit = validate.get_release_type(
-            deliv,
-            deliv.releases[0].projects[0].repo,
-            self.tmpdir,
-        )
-        self.assertEqual(('python-pypi', False), (release_type, explicit))
-
-    def test_service(self):
-        deliv = deliverable.Deliverable(
-            team='team',
-            series=defaults.RELEASE,
-            name='name',
-            data={
-                'artifact-link-mode': 'none',
-                'type': 'service',
-                'releases': [
-                    {'version': '99.1.0',
-                     'projects': [
-                         {'repo': 'openstack/puppet-watcher',
-                          'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
-                     ]}
-                ],
-            },
-        )
-        release_type, explicit = validate.get_release_type(
-            deliv,
-            deliv.releases[0].projects[0].repo,
-            self.tmpdir,
-        )
-        self.assertEqual(('python-service', False), (release_type, explicit))
-
-    def test_implicit_pypi(self):
-        deliv = deliverable.Deliverable(
-            team='team',
-            series=defaults.RELEASE,
-            name='name',
-            data={
-                'artifact-link-mode': 'none',
-                'include-pypi-link': True,
-                'releases': [
-                    {'version': '99.1.0',
-                     'projects': [
-                         {'repo': 'openstack/puppet-watcher',
-                          'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
-                     ]}
-                ],
-            },
-        )
-        release_type, explicit = validate.get_release_type(
-            deliv,
-            deliv.releases[0].projects[0].repo,
-            self.tmpdir,
+            }
         )
-        self.assertEqual(('python-pypi', False), (release_type, explicit))
+        validate.validate_version_numbers(deliv, self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=0)
 
-    def test_pypi_false(self):
+    def test_em_valid_version(self):
         deliv = deliverable.Deliverable(
             team='team',
-            series=defaults.RELEASE,
+            series='ocata',
             name='name',
             data={
                 'artifact-link-mode': 'none',
-                'include-pypi-link': False,
                 'releases': [
-                    {'version': '99.1.0',
+                    {'version': 'ocata-em',
                      'projects': [
-                         {'repo': 'openstack/puppet-watcher',
-                          'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
+                         {'repo': 'openstack/release-test',
+                          'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
                      ]}
                 ],
-            },
-        )
-        release_type, explicit = validate.get_release_type(
-            deliv,
-            deliv.releases[0].projects[0].repo,
-            self.tmpdir,
+            }
         )
-        self.assertEqual(('python-service', False), (release_type, explicit))
+        validate.validate_version_numbers(deliv, self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=0)
 
-    @mock.patch('openstack_releases.puppetutils.looks_like_a_module')
-    def test_puppet(self, llam):
-        llam.return_value = True
+    def test_eol_wrong_branch(self):
         deliv = deliverable.Deliverable(
             team='team',
-            series=defaults.RELEASE,
+            series='ocata',
             name='name',
             data={
                 'artifact-link-mode': 'none',
                 'releases': [
-                    {'version': '99.1.0',
+                    {'version': 'newton-eol',
                      'projects': [
-                         {'repo': 'openstack/puppet-watcher',
-                          'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
+                         {'repo': 'openstack/release-test',
+                          'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
                      ]}
                 ],
-            },
-        )
-        release_type, explicit = validate.get_release_type(
-            deliv,
-            deliv.releases[0].projects[0].repo,
-            self.tmpdir,
+            }
         )
-        self.assertEqual(('puppet', False), (release_type, explicit))
+        validate.validate_version_numbers(deliv, self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=1)
 
-    @mock.patch('openstack_releases.npmutils.looks_like_a_module')
-    def test_nodejs(self, llam):
-        llam.return_value = True
+    def test_em_wrong_branch(self):
         deliv = deliverable.Deliverable(
             team='team',
-            series=defaults.RELEASE,
+            series='ocata',
             name='name',
             data={
                 'artifact-link-mode': 'none',
                 'releases': [
-                    {'version': '99.1.0',
+                    {'version': 'newton-em',
                      'projects': [
-                         {'repo': 'openstack/puppet-watcher',
-                          'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
+                         {'repo': 'openstack/release-test',
+                          'hash': 'a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5'},
                      ]}
                 ],
-            },
-        )
-        release_type, explicit = validate.get_release_type(
-            deliv,
-            deliv.releases[0].projects[0].repo,
-            self.tmpdir,
+            }
         )
-        self.assertEqual(('nodejs', False), (release_type, explicit))
+        validate.validate_version_numbers(deliv, self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=1)
 
-    @mock.patch('openstack_releases.puppetutils.looks_like_a_module')
-    @mock.patch('openstack_releases.npmutils.looks_like_a_module')
-    def test_python_server(self, nllam, pllam):
-        pllam.return_value = False
-        nllam.return_value = False
+    def test_no_releases(self):
+        # When we initialize a new series, we won't have any release
+        # data. That's OK.
         deliv = deliverable.Deliverable(
             team='team',
-            series=defaults.RELEASE,
+            series='ocata',
             name='name',
             data={
                 'artifact-link-mode': 'none',
-                'releases': [
-                    {'version': '99.1.0',
-                     'projects': [
-                         {'repo': 'openstack/puppet-watcher',
-                          'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
-                     ]}
-                ],
-            },
+                'releases': []
+            }
+        )
+        validate.validate_version_numbers(deliv, self.ctx)
+        self.ctx.show_summary()
+        self.assertMessageCounts(warnings=0, errors=0)
+
+
+class TestGetReleaseType(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        self.ctx = validate.ValidationContext()
+        self.puppet_module = self.useFixture(fixtures.MockPatch(
+            'openstack_releases.puppetutils.looks_like_a_module',
+            return_value=False,
+        )).mock
+        self.npm_module = self.useFixture(fixtures.MockPatch(
+            'openstack_releases.npmutils.looks_like_a_module',
+            return_value=False,
+        )).mock
+
+    def _get_release_type(self, settings):
+        # Every test releases the same project, and only the
+        # deliverable settings change.
+        data = {
+            'artifact-link-mode': 'none',
+            'releases': [
+                {'version': '99.1.0',
+                 'projects': [
+                     {'repo': 'openstack/puppet-watcher',
+                      'hash': '1e7baef27139f69a83e1fe28686bb72ee7e1d6fa'},
+                 ]}
+            ],
+        }
+        data.update(settings)
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='name',
+            data=data,
         )
-        release_type, explicit = validate.get_release_type(
+        return validate.get_release_type(
             deliv,
             deliv.releases[0].projects[0].repo,
             self.tmpdir,
         )
-        self.assertEqual(('python-service', False), (release_type, explicit))
+
+    def test_explicit(self):
+        self.assertEqual(
+            ('explicitly-set', True),
+            self._get_release_type({'release-type': 'explicitly-set'}),
+        )
+
+    def test_library(self):
+        self.assertEqual(
+            ('python-pypi', False),
+            self._get_release_type({'type': 'library'}),
+        )
+
+    def test_service(self):
+        self.assertEqual(
+            ('python-service', False),
+            self._get_release_type({'type': 'service'}),
+        )
+
+    def test_implicit_pypi(self):
+        self.assertEqual(
+            ('python-pypi', False),
+            self._get_release_type({'include-pypi-link': True}),
+        )
+
+    def test_pypi_false(self):
+        self.assertEqual(
+            ('python-service', False),
+            self._get_release_type({'include-pypi-link': False}),
+        )
+
+    def test_settings_skip_module_probes(self):
+        for settings in [{'release-type': 'explicitly-set'},
+                         {'type': 'library'},
+                         {'include-pypi-link': True}]:
+            self._get_release_type(settings)
+        self.puppet_module.assert_not_called()
+        self.npm_module.assert_not_called()
+
+    def test_puppet(self):
+        self.puppet_module.return_value = True
+        self.assertEqual(
+            ('puppet', False),
+            self._get_release_type({}),
+        )
+
+    def test_nodejs(self):
+        self.npm_module.return_value = True
+        self.assertEqual(
+            ('nodejs', False),
+            self._get_release_type({}),
+        )
+
+    def test_python_server(self):
+        self.assertEqual(
+            ('python-service', False),
+            self._get_release_type({}),
+        )
 
 
-class TestPuppetUtils(base.BaseTestCase):
+class TestPuppetUtils(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.tmpdir = self.useFixture(fixtures.TempDir()).path
-        self.ctx = validate.ValidationContext()
         self.useFixture(fixtures.MonkeyPatch(
             'openstack_releases.cmds.validate.includes_new_tag',
             mock.Mock(return_value=True),
         ))
+        self.useFixture(fixtures.MockPatch(
+            'openstack_releases.gitutils.check_branch_sha',
+            return_value=True,
+        ))
+        self.useFixture(fixtures.MockPatch(
+            'openstack_releases.puppetutils.get_version',
+            return_value='99.1.0',
+        ))
+        self.useFixture(fixtures.MockPatch(
+            'openstack_releases.puppetutils.looks_like_a_module',
+            return_value=True,
+        ))
 
-    @mock.patch('openstack_releases.gitutils.check_branch_sha')
-    @mock.patch('openstack_releases.puppetutils.get_version')
-    @mock.patch('openstack_releases.puppetutils.looks_like_a_module')
-    def test_valid_version(self, llam, get_version, cbs):
-        llam.return_value = True
-        get_version.return_value = '99.1.0'
-        cbs.return_value = True
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/puppet-watcher')
+    def test_valid_version(self):
+        _clone_repo(self.ctx.workdir, 'openstack/puppet-watcher')
         deliv = deliverable.Deliverable(
             team='team',
             series='ocata',
@@ -1582,17 +2169,10 @@ class TestPuppetUtils(base.BaseTestCase):
         )
         validate.validate_version_numbers(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
-    @mock.patch('openstack_releases.gitutils.check_branch_sha')
-    @mock.patch('openstack_releases.puppetutils.get_version')
-    @mock.patch('openstack_releases.puppetutils.looks_like_a_module')
-    def test_mismatched_version(self, llam, get_version, cbs):
-        llam.return_value = True
-        get_version.return_value = '99.1.0'
-        cbs.return_value = True
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/puppet-watcher')
+    def test_mismatched_version(self):
+        _clone_repo(self.ctx.workdir, 'openstack/puppet-watcher')
         deliv = deliverable.Deliverable(
             team='team',
             series=defaults.RELEASE,
@@ -1610,15 +2190,24 @@ class TestPuppetUtils(base.BaseTestCase):
         )
         validate.validate_version_numbers(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
+
 
+def _clone_repo_from_cache(workdir, repo, *args, **kwargs):
+    "Replacement for gitutils.clone_repo() using the shared clones."
+    _clone_repo(workdir, repo)
 
-class TestValidateTarballBase(base.BaseTestCase):
+
+class TestValidateTarballBase(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
+        # clone_deliverable() checks out master, like the shared
+        # clones, so copy those instead of cloning for every test.
+        self.useFixture(fixtures.MockPatch(
+            'openstack_releases.gitutils.clone_repo',
+            side_effect=_clone_repo_from_cache,
+        ))
 
     @mock.patch('openstack_releases.project_config.require_release_jobs_for_repo')
     @mock.patch('openstack_releases.pythonutils.get_sdist_name')
@@ -1641,8 +2230,7 @@ class TestValidateTarballBase(base.BaseTestCase):
         validate.clone_deliverable(deliv, self.ctx)
         validate.validate_tarball_base(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     @mock.patch('openstack_releases.project_config.require_release_jobs_for_repo')
     @mock.patch('openstack_releases.pythonutils.get_sdist_name')
@@ -1666,8 +2254,7 @@ class TestValidateTarballBase(base.BaseTestCase):
         validate.clone_deliverable(deliv, self.ctx)
         validate.validate_tarball_base(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     @mock.patch('openstack_releases.project_config.require_release_jobs_for_repo')
     @mock.patch('openstack_releases.pythonutils.get_sdist_name')
@@ -1690,8 +2277,7 @@ class TestValidateTarballBase(base.BaseTestCase):
         validate.clone_deliverable(deliv, self.ctx)
         validate.validate_tarball_base(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     @mock.patch('openstack_releases.project_config.require_release_jobs_for_repo')
     @mock.patch('openstack_releases.pythonutils.get_sdist_name')
@@ -1715,8 +2301,7 @@ class TestValidateTarballBase(base.BaseTestCase):
         validate.clone_deliverable(deliv, self.ctx)
         validate.validate_tarball_base(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     @mock.patch('openstack_releases.project_config.require_release_jobs_for_repo')
     @mock.patch('openstack_releases.pythonutils.get_sdist_name')
@@ -1740,11 +2325,10 @@ class TestValidateTarballBase(base.BaseTestCase):
         validate.clone_deliverable(deliv, self.ctx)
         validate.validate_tarball_base(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidateNewReleases(base.BaseTestCase):
+class TestValidateNewReleases(ValidationTestCase):
 
     team_data_yaml = textwrap.dedent("""
     Release Management:
@@ -1784,12 +2368,11 @@ class TestValidateNewReleases(base.BaseTestCase):
             - openstack-dev/specs-cookiecutter
     """)
 
-    team_data = yamlutils.loads(team_data_yaml)
+    team_data = yamlutils.safe_load(team_data_yaml)
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        self.ctx._team_data = self.team_data
+        self.ctx._gov_data = _governance(self.team_data)
 
     def test_all_repos(self):
         # The repos in the tag, governance, and repository-settings
@@ -1814,8 +2397,7 @@ class TestValidateNewReleases(base.BaseTestCase):
             }
         )
         validate.validate_new_releases(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_extra_repo_gov(self):
         # The tag includes a repo not in governance.
@@ -1843,8 +2425,7 @@ class TestValidateNewReleases(base.BaseTestCase):
             }
         )
         validate.validate_new_releases(deliv, self.ctx)
-        self.assertEqual(1, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=1, errors=0)
 
     def test_missing_repo_gov(self):
         # The tag is missing a repo in governance.
@@ -1873,8 +2454,7 @@ class TestValidateNewReleases(base.BaseTestCase):
         )
         validate.validate_new_releases(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(1, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=1, errors=0)
 
     def test_extra_repo_info(self):
         # The tag has a repo not in repository-settings or governance
@@ -1899,8 +2479,7 @@ class TestValidateNewReleases(base.BaseTestCase):
         )
         validate.validate_new_releases(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_missing_repo_info(self):
         # The tag is missing a repository that is in
@@ -1927,15 +2506,43 @@ class TestValidateNewReleases(base.BaseTestCase):
         )
         validate.validate_new_releases(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
-
+        self.assertMessageCounts(warnings=0, errors=1)
+
+    def test_missing_repos_info_sorted(self):
+        # Several repositories in repository-settings are missing from
+        # the tag, and they are reported in order.
+        repo = mock.Mock()
+        repo.name = 'openstack/release-test'
+        self.ctx._gov_data = mock.Mock()
+        self.ctx._gov_data.get_repositories.return_value = [repo]
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='release-test',
+            data={
+                'artifact-link-mode': 'none',
+                'repository-settings': {
+                    'openstack/release-test': {},
+                    'openstack/zz-made-up-name': {},
+                    'openstack/aa-made-up-name': {},
+                },
+                'releases': [
+                    {'version': '1000.0.0',
+                     'projects': [
+                         {'repo': 'openstack/release-test',
+                          'hash': '685da43147c3bedc24906d5a26839550f2e962b1',
+                          'tarball-base': 'openstack-release-test'},
+                     ]}
+                ],
+            }
+        )
+        validate.validate_new_releases(deliv, self.ctx)
+        self.assertMessageCounts(warnings=0, errors=2)
+        self.assertIn('openstack/aa-made-up-name', self.ctx.errors[0])
+        self.assertIn('openstack/zz-made-up-name', self.ctx.errors[1])
 
-class TestValidateBranchPrefixes(base.BaseTestCase):
 
-    def setUp(self):
-        super().setUp()
-        self.ctx = validate.ValidationContext()
+class TestValidateBranchPrefixes(ValidationTestCase):
 
     def test_invalid_prefix(self):
         deliv = deliverable.Deliverable(
@@ -1950,36 +2557,61 @@ class TestValidateBranchPrefixes(base.BaseTestCase):
             }
         )
         validate.validate_branch_prefixes(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
+        self.assertIn('bugfix, feature, stable', self.ctx.errors[0])
 
     def test_valid_prefix(self):
-        for prefix in validate._VALID_BRANCH_PREFIXES:
-            deliv = deliverable.Deliverable(
-                team='team',
-                series=defaults.RELEASE,
-                name='release-test',
-                data={
-                    'branches': [
-                        {'name': '%s/branch' % prefix,
-                         'location': ''},
-                    ],
-                }
-            )
-            validate.validate_branch_prefixes(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='release-test',
+            data={
+                'branches': [
+                    {'name': '%s/branch' % prefix,
+                     'location': ''}
+                    for prefix in sorted(validate._VALID_BRANCH_PREFIXES)
+                ],
+            }
+        )
+        validate.validate_branch_prefixes(deliv, self.ctx)
+        self.assertMessageCounts(warnings=0, errors=0)
+
+    def test_valid_and_invalid_prefix(self):
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=defaults.RELEASE,
+            name='release-test',
+            data={
+                'branches': [
+                    {'name': 'stable/branch',
+                     'location': ''},
+                    {'name': 'invalid/branch',
+                     'location': ''},
+                ],
+            }
+        )
+        validate.validate_branch_prefixes(deliv, self.ctx)
+        self.assertMessageCounts(warnings=0, errors=1)
+        self.assertIn('invalid/branch', self.ctx.errors[0])
 
 
-class TestValidateStableBranches(base.BaseTestCase):
+class TestValidateStableBranches(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/release-test')
+        _clone_repo(self.ctx.workdir, 'openstack/release-test')
+
+    def _validate_stable_branches(self, deliverable_data, series='ocata'):
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=series,
+            name='release-test',
+            data=yamlutils.safe_load(textwrap.dedent(deliverable_data)),
+        )
+        validate.validate_stable_branches(deliv, self.ctx)
 
     def test_version_in_deliverable(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         releases:
           - version: 99.0.3
             projects:
@@ -1991,18 +2623,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_badly_formatted_name(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         releases:
           - version: 99.0.3
             projects:
@@ -2014,18 +2638,25 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
+
+    def test_too_many_separators(self):
+        self._validate_stable_branches('''
+        releases:
+          - version: 99.0.3
+            projects:
+              - repo: openstack/release-test
+                hash: 0cd17d1ee3b9284d36b2a0d370b49a6f0bbb9660
+        branches:
+          - name: stable/ocata/extra
+            location: 99.0.3
+        repository-settings:
+          openstack/release-test: {}
+        ''')
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_version_not_in_deliverable(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         releases:
           - version: 99.0.3
             projects:
@@ -2037,18 +2668,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_version_not_last(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         releases:
           - version: 99.0.3
             projects:
@@ -2064,18 +2687,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_mismatched_series_cycle(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         releases:
           - version: 99.0.3
             projects:
@@ -2086,20 +2701,12 @@ class TestValidateStableBranches(base.BaseTestCase):
             location: 99.0.3
         repository-settings:
           openstack/release-test: {}
-        ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='series-name-does-not-match',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
+        ''', series='series-name-does-not-match')
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_without_repository_settings(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         releases:
           - version: 99.0.3
             projects:
@@ -2110,20 +2717,12 @@ class TestValidateStableBranches(base.BaseTestCase):
             location: 99.0.3
         repository-settings:
           openstack/release-test: {}
-        ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='series-name-does-not-match',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
+        ''', series='series-name-does-not-match')
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_unknown_series_independent(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         releases:
           - version: 99.0.3
             projects:
@@ -2134,20 +2733,12 @@ class TestValidateStableBranches(base.BaseTestCase):
             location: 99.0.3
         repository-settings:
           openstack/release-test: {}
-        ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='independent',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
+        ''', series='independent')
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_can_have_independent_branches(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         # NOTE(dhellmann): This launchpad setting is required.
         # See validate._NO_STABLE_BRANCH_CHECK.
         launchpad: gnocchi
@@ -2161,20 +2752,12 @@ class TestValidateStableBranches(base.BaseTestCase):
             location: 99.0.3
         repository-settings:
           openstack/release-test: {}
-        ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='independent',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
+        ''', series='independent')
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_explicit_stable_branch_type(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         stable-branch-type: std
         releases:
           - version: 99.0.3
@@ -2187,18 +2770,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_explicit_stable_branch_type_invalid(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         stable-branch-type: unknown
         releases:
           - version: 99.0.3
@@ -2211,18 +2786,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_std_with_versions_stable_branch_type(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         stable-branch-type: std-with-versions
         releases:
           - version: 99.0.3
@@ -2235,18 +2802,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_std_with_versions_normal_stable_branch_type(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         stable-branch-type: std-with-versions
         releases:
           - version: 99.0.3
@@ -2259,18 +2818,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_tagless_stable_branch_type_bad_location_type(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         stable-branch-type: tagless
         releases:
           - version: 99.0.3
@@ -2283,18 +2834,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_tagless_stable_branch_type_bad_location_value(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         stable-branch-type: tagless
         releases:
           - version: 99.0.3
@@ -2308,18 +2851,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_tagless_stable_branch_type(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         stable-branch-type: tagless
         releases:
           - version: 99.0.3
@@ -2333,18 +2868,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_tempest_plugin(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         type: tempest-plugin
         releases:
           - version: 99.0.3
@@ -2358,18 +2885,10 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_none_stable_branch_type(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_stable_branches('''
         type: other
         stable-branch-type: none
         releases:
@@ -2384,26 +2903,26 @@ class TestValidateStableBranches(base.BaseTestCase):
         repository-settings:
           openstack/release-test: {}
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_stable_branches(deliv, self.ctx)
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidateFeatureBranches(base.BaseTestCase):
+class TestValidateFeatureBranches(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/release-test')
+        _clone_repo(self.ctx.workdir, 'openstack/release-test')
+
+    def _validate_feature_branches(self, deliverable_data, series='ocata'):
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=series,
+            name='release-test',
+            data=yamlutils.safe_load(textwrap.dedent(deliverable_data)),
+        )
+        validate.validate_feature_branches(deliv, self.ctx)
 
     def test_location_not_a_dict(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_feature_branches('''
         releases:
           - version: 0.0.3
             projects:
@@ -2413,19 +2932,11 @@ class TestValidateFeatureBranches(base.BaseTestCase):
           - name: feature/abc
             location: 0.0.3
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_feature_branches(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_location_not_a_sha(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_feature_branches('''
         releases:
           - version: 0.0.3
             projects:
@@ -2436,19 +2947,11 @@ class TestValidateFeatureBranches(base.BaseTestCase):
             location:
                openstack/release-test: 0.0.3
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_feature_branches(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_location_a_sha(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_feature_branches('''
         releases:
           - version: 0.0.3
             projects:
@@ -2459,19 +2962,11 @@ class TestValidateFeatureBranches(base.BaseTestCase):
             location:
                openstack/release-test: 0cd17d1ee3b9284d36b2a0d370b49a6f0bbb9660
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_feature_branches(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_badly_formatted_name(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_feature_branches('''
         releases:
           - version: 0.0.3
             projects:
@@ -2482,19 +2977,11 @@ class TestValidateFeatureBranches(base.BaseTestCase):
             location:
                openstack/release-test: 0cd17d1ee3b9284d36b2a0d370b49a6f0bbb9660
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_feature_branches(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_location_no_such_sha(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_feature_branches('''
         releases:
           - version: 0.0.3
             projects:
@@ -2505,19 +2992,11 @@ class TestValidateFeatureBranches(base.BaseTestCase):
             location:
                openstack/release-test: de2885f544637e6ee6139df7dc7bf937925804dd
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_feature_branches(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_tempest_plugin(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_feature_branches('''
         type: tempest-plugin
         releases:
           - version: 0.0.3
@@ -2529,24 +3008,24 @@ class TestValidateFeatureBranches(base.BaseTestCase):
             location:
                openstack/release-test: 0cd17d1ee3b9284d36b2a0d370b49a6f0bbb9660
         ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='release-test',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_feature_branches(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidateSeriesOpen(base.BaseTestCase):
+class TestValidateSeriesOpen(ValidationTestCase):
+
+    _deliverable_data = textwrap.dedent('''
+    ---
+    releases:
+      - version: 1.5.0
+        projects:
+          - repo: openstack/automaton
+            hash: be2885f544637e6ee6139df7dc7bf937925804dd
+    ''')
 
     def setUp(self):
         super().setUp()
         self.tmpdir = self.useFixture(fixtures.TempDir()).path
-        self.ctx = validate.ValidationContext()
         self.useFixture(fixtures.MonkeyPatch(
             'openstack_releases.cmds.validate.includes_new_tag',
             mock.Mock(return_value=True),
@@ -2565,14 +3044,7 @@ class TestValidateSeriesOpen(base.BaseTestCase):
           - name: stable/a
             location: 1.4.0
         ''')
-        deliverable_data = textwrap.dedent('''
-        ---
-        releases:
-          - version: 1.5.0
-            projects:
-              - repo: openstack/automaton
-                hash: be2885f544637e6ee6139df7dc7bf937925804dd
-        ''')
+        deliverable_data = self._deliverable_data
         with open(series_a_filename, 'w') as f:
             f.write(branch_data)
         with open(series_b_filename, 'w') as f:
@@ -2581,60 +3053,81 @@ class TestValidateSeriesOpen(base.BaseTestCase):
             team='team',
             series='b',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         self.ctx.set_filename(series_b_filename)
         validate.validate_series_open(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
-    def test_no_earlier_series(self):
+    def test_previous_series_already_read(self):
+        # The copy of the previous deliverable that the context already
+        # has is used instead of reading the file again.
+        series_a_dir = self.tmpdir + '/a'
+        series_a_filename = series_a_dir + '/automaton.yaml'
         series_b_dir = self.tmpdir + '/b'
         series_b_filename = series_b_dir + '/automaton.yaml'
+        os.makedirs(series_a_dir)
         os.makedirs(series_b_dir)
-        deliverable_data = textwrap.dedent('''
+        branch_data = textwrap.dedent('''
         ---
-        releases:
-          - version: 1.5.0
-            projects:
-              - repo: openstack/automaton
-                hash: be2885f544637e6ee6139df7dc7bf937925804dd
+        branches:
+          - name: stable/a
+            location: 1.4.0
         ''')
+        deliverable_data = self._deliverable_data
+        with open(series_a_filename, 'w') as f:
+            f.write(deliverable_data)
+        with open(series_b_filename, 'w') as f:
+            f.write(deliverable_data)
+        self.ctx.add_deliverables({
+            series_a_filename: deliverable.Deliverable(
+                team='team',
+                series='a',
+                name='name',
+                data=yamlutils.safe_load(branch_data),
+            ),
+        })
+        deliv = deliverable.Deliverable(
+            team='team',
+            series='b',
+            name='name',
+            data=yamlutils.safe_load(deliverable_data),
+        )
+        self.ctx.set_filename(series_b_filename)
+        validate.validate_series_open(deliv, self.ctx)
+        self.assertMessageCounts(warnings=0, errors=0)
+
+    def test_no_earlier_series(self):
+        series_b_dir = self.tmpdir + '/b'
+        series_b_filename = series_b_dir + '/automaton.yaml'
+        os.makedirs(series_b_dir)
+        deliverable_data = self._deliverable_data
         with open(series_b_filename, 'w') as f:
             f.write(deliverable_data)
         deliv = deliverable.Deliverable(
             team='team',
             series='b',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         self.ctx.set_filename(series_b_filename)
         validate.validate_series_open(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_independent(self):
-        deliverable_data = textwrap.dedent('''
-        ---
-        releases:
-          - version: 1.5.0
-            projects:
-              - repo: openstack/automaton
-                hash: be2885f544637e6ee6139df7dc7bf937925804dd
-        ''')
+        deliverable_data = self._deliverable_data
         deliv = deliverable.Deliverable(
             team='team',
             series='independent',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         self.ctx.set_filename('filename')  # not used
         validate.validate_series_open(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_no_stable_branch(self):
         series_a_dir = self.tmpdir + '/a'
@@ -2646,14 +3139,7 @@ class TestValidateSeriesOpen(base.BaseTestCase):
         branch_data = textwrap.dedent('''
         ---
         ''')
-        deliverable_data = textwrap.dedent('''
-        ---
-        releases:
-          - version: 1.5.0
-            projects:
-              - repo: openstack/automaton
-                hash: be2885f544637e6ee6139df7dc7bf937925804dd
-        ''')
+        deliverable_data = self._deliverable_data
         with open(series_a_filename, 'w') as f:
             f.write(branch_data)
         with open(series_b_filename, 'w') as f:
@@ -2662,21 +3148,19 @@ class TestValidateSeriesOpen(base.BaseTestCase):
             team='team',
             series=defaults.RELEASE,
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         self.ctx.set_filename(series_b_filename)
         validate.validate_series_open(deliv, self.ctx)
         self.ctx.show_summary()
-        self.assertEqual(1, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=1, errors=0)
 
 
-class TestValidateSeriesFirst(base.BaseTestCase):
+class TestValidateSeriesFirst(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
         self.tmpdir = self.useFixture(fixtures.TempDir()).path
-        self.ctx = validate.ValidationContext()
         self.useFixture(fixtures.MonkeyPatch(
             'openstack_releases.cmds.validate.includes_new_tag',
             mock.Mock(return_value=True),
@@ -2700,15 +3184,14 @@ class TestValidateSeriesFirst(base.BaseTestCase):
             team='team',
             series='a',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         validate.validate_series_first(
             deliv,
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_ignore_if_second_release(self):
         series_a_dir = self.tmpdir + '/a'
@@ -2732,15 +3215,14 @@ class TestValidateSeriesFirst(base.BaseTestCase):
             team='team',
             series='a',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         validate.validate_series_first(
             deliv,
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_ignore_if_no_releases(self):
         series_a_dir = self.tmpdir + '/a'
@@ -2756,15 +3238,14 @@ class TestValidateSeriesFirst(base.BaseTestCase):
             team='team',
             series='a',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         validate.validate_series_first(
             deliv,
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_version_bad(self):
         series_a_dir = self.tmpdir + '/a'
@@ -2784,15 +3265,14 @@ class TestValidateSeriesFirst(base.BaseTestCase):
             team='team',
             series='a',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         validate.validate_series_first(
             deliv,
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_beta_1(self):
         series_a_dir = self.tmpdir + '/a'
@@ -2812,15 +3292,14 @@ class TestValidateSeriesFirst(base.BaseTestCase):
             team='team',
             series='a',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         validate.validate_series_first(
             deliv,
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_beta_2(self):
         series_a_dir = self.tmpdir + '/a'
@@ -2840,15 +3319,14 @@ class TestValidateSeriesFirst(base.BaseTestCase):
             team='team',
             series='a',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         validate.validate_series_first(
             deliv,
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_branchless(self):
         series_a_dir = self.tmpdir + '/a'
@@ -2869,30 +3347,27 @@ class TestValidateSeriesFirst(base.BaseTestCase):
             team='team',
             series='a',
             name='name',
-            data=yamlutils.loads(deliverable_data),
+            data=yamlutils.safe_load(deliverable_data),
         )
         validate.validate_series_first(
             deliv,
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
 
-class TestValidateSeriesFinal(base.BaseTestCase):
+class TestValidateSeriesFinal(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.tmpdir = self.useFixture(fixtures.TempDir()).path
-        self.ctx = validate.ValidationContext()
         self.useFixture(fixtures.MonkeyPatch(
             'openstack_releases.cmds.validate.includes_new_tag',
             mock.Mock(return_value=True),
         ))
 
     def test_no_releases(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         '''))
@@ -2907,11 +3382,10 @@ class TestValidateSeriesFinal(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_only_rc(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -2931,11 +3405,10 @@ class TestValidateSeriesFinal(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_no_rc(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -2959,11 +3432,10 @@ class TestValidateSeriesFinal(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_rc_with_final_match(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -2987,11 +3459,10 @@ class TestValidateSeriesFinal(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_rc_with_final_mismatch(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3015,11 +3486,10 @@ class TestValidateSeriesFinal(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_rc_with_final_mismatch_many_rcs(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3047,11 +3517,10 @@ class TestValidateSeriesFinal(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_match_wrong_rc(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3079,23 +3548,20 @@ class TestValidateSeriesFinal(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidateSeriesEOL(base.BaseTestCase):
+class TestValidateSeriesEOL(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.tmpdir = self.useFixture(fixtures.TempDir()).path
-        self.ctx = validate.ValidationContext()
         self.useFixture(fixtures.MonkeyPatch(
             'openstack_releases.cmds.validate.includes_new_tag',
             mock.Mock(return_value=True),
         ))
 
     def test_no_releases(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         '''))
@@ -3110,11 +3576,10 @@ class TestValidateSeriesEOL(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_only_normal(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3134,11 +3599,10 @@ class TestValidateSeriesEOL(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_no_eol(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3162,11 +3626,10 @@ class TestValidateSeriesEOL(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_eol_ok(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3193,11 +3656,10 @@ class TestValidateSeriesEOL(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_eol_missing_repo(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3223,11 +3685,10 @@ class TestValidateSeriesEOL(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_eol_branchless(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3249,23 +3710,20 @@ class TestValidateSeriesEOL(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidateSeriesEM(base.BaseTestCase):
+class TestValidateSeriesEM(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.tmpdir = self.useFixture(fixtures.TempDir()).path
-        self.ctx = validate.ValidationContext()
         self.useFixture(fixtures.MonkeyPatch(
             'openstack_releases.cmds.validate.includes_new_tag',
             mock.Mock(return_value=True),
         ))
 
     def test_no_releases(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         '''))
@@ -3280,11 +3738,10 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_only_normal(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3304,11 +3761,10 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_no_em(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3332,11 +3788,10 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_em_ok(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3363,11 +3818,10 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_em_no_releases(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3387,11 +3841,10 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_em_not_matching_last_release(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3424,11 +3877,10 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_em_matches_last_release(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3461,11 +3913,10 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_em_missing_repo(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3495,11 +3946,10 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_em_branchless(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         releases:
@@ -3523,23 +3973,20 @@ class TestValidateSeriesEM(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidatePreReleaseProgression(base.BaseTestCase):
+class TestValidatePreReleaseProgression(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.tmpdir = self.useFixture(fixtures.TempDir()).path
-        self.ctx = validate.ValidationContext()
         self.useFixture(fixtures.MonkeyPatch(
             'openstack_releases.cmds.validate.includes_new_tag',
             mock.Mock(return_value=True),
         ))
 
     def test_no_releases(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         release-model: cycle-with-rc
@@ -3555,11 +4002,10 @@ class TestValidatePreReleaseProgression(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_only_rc(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         release-model: cycle-with-rc
@@ -3580,11 +4026,10 @@ class TestValidatePreReleaseProgression(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_missing_rc(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         release-model: cycle-with-rc
@@ -3605,11 +4050,10 @@ class TestValidatePreReleaseProgression(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_final_follows_rc(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         release-model: cycle-with-rc
@@ -3634,11 +4078,10 @@ class TestValidatePreReleaseProgression(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_final_follows_multiple_rc(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         release-model: cycle-with-rc
@@ -3667,11 +4110,10 @@ class TestValidatePreReleaseProgression(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_rc_follows_final(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         release-model: cycle-with-rc
@@ -3696,11 +4138,10 @@ class TestValidatePreReleaseProgression(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
     def test_rc_follows_beta(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         release-model: cycle-with-rc
@@ -3725,11 +4166,10 @@ class TestValidatePreReleaseProgression(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_final_follows_beta(self):
-        deliverable_data = yamlutils.loads(textwrap.dedent('''
+        deliverable_data = yamlutils.safe_load(textwrap.dedent('''
         ---
         team: Release Management
         release-model: cycle-with-rc
@@ -3754,19 +4194,26 @@ class TestValidatePreReleaseProgression(base.BaseTestCase):
             self.ctx,
         )
         self.ctx.show_summary()
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        self.assertMessageCounts(warnings=0, errors=1)
 
 
-class TestValidateBranchPoints(base.BaseTestCase):
+class TestValidateBranchPoints(ValidationTestCase):
 
     def setUp(self):
         super().setUp()
-        self.ctx = validate.ValidationContext()
-        gitutils.clone_repo(self.ctx.workdir, 'openstack/release-test')
+        _clone_repo(self.ctx.workdir, 'openstack/release-test')
+
+    def _validate_branch_points(self, deliverable_data, series):
+        deliv = deliverable.Deliverable(
+            team='team',
+            series=series,
+            name='name',
+            data=yamlutils.safe_load(textwrap.dedent(deliverable_data)),
+        )
+        validate.validate_branch_points(deliv, self.ctx)
 
     def test_branch_does_not_exist(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_branch_points('''
         releases:
           - version: 0.0.3
             projects:
@@ -3775,22 +4222,11 @@ class TestValidateBranchPoints(base.BaseTestCase):
         branches:
           - name: stable/ocata
             location: 0.0.3
-        ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='ocata',
-            name='name',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_branch_points(
-            deliv,
-            self.ctx,
-        )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        ''', series='ocata')
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_branch_is_correct(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_branch_points('''
         releases:
           - version: 0.8.0
             projects:
@@ -3799,22 +4235,11 @@ class TestValidateBranchPoints(base.BaseTestCase):
         branches:
           - name: stable/newton
             location: 0.8.0
-        ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='newton',
-            name='name',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_branch_points(
-            deliv,
-            self.ctx,
-        )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(0, len(self.ctx.errors))
+        ''', series='newton')
+        self.assertMessageCounts(warnings=0, errors=0)
 
     def test_branch_moved(self):
-        deliverable_data = textwrap.dedent('''
+        self._validate_branch_points('''
         releases:
           - version: 0.12.0
             projects:
@@ -3824,16 +4249,18 @@ class TestValidateBranchPoints(base.BaseTestCase):
           - name: stable/meiji
             location: 0.12.0  # this comes after the meiji branch
                               # was created at 0.0.2
-        ''')
-        deliv = deliverable.Deliverable(
-            team='team',
-            series='meiji',
-            name='name',
-            data=yamlutils.loads(deliverable_data),
-        )
-        validate.validate_branch_points(
-            deliv,
-            self.ctx,
-        )
-        self.assertEqual(0, len(self.ctx.warnings))
-        self.assertEqual(1, len(self.ctx.errors))
+        ''', series='meiji')
+        self.assertMessageCounts(warnings=0, errors=1)
+
+    def test_unknown_version(self):
+        self._validate_branch_points('''
+        releases:
+          - version: 0.8.0
+            projects:
+              - repo: openstack/release-test
+                hash: a26e6a2e8a5e321b2e3517dbb01a7b9a56a8bfd5
+        branches:
+          - name: stable/newton
+            location: 0.8.1
+        ''', series='newton')
+        self.assertMessageCounts(warnings=0, errors=0)
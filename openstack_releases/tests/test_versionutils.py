@@ -49,3 +49,8 @@ class TestValidateVersion(base.BaseTestCase):
     def test_pre_ok(self):
         errors = list(versionutils.validate_version('1.2.3.0rc1'))
         self.assertEqual(0, len(errors))
+
+    def test_cached(self):
+        errors = versionutils.validate_version('1.2.3.4')
+        self.assertIsInstance(errors, tuple)
+        self.assertIs(errors, versionutils.validate_version('1.2.3.4'))
@@ -0,0 +1,71 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+import textwrap
+
+from oslotest import base
+import yaml
+
+from openstack_releases import yamlutils
+
+
+class TestSafeLoad(base.BaseTestCase):
+
+    _body = textwrap.dedent('''
+    ---
+    team: Release Management
+    releases:
+      - version: 1.0.0
+        projects:
+          - repo: openstack/release-test
+            hash: 0cd17d1ee3b9284d36b2a0d370b49a6d2bbd9d65
+    ''')
+
+    def test_same_as_loads(self):
+        self.assertEqual(
+            yamlutils.loads(self._body),
+            yamlutils.safe_load(self._body),
+        )
+
+    def test_stream(self):
+        self.assertEqual(
+            yamlutils.loads(self._body),
+            yamlutils.safe_load(io.StringIO(self._body)),
+        )
+
+    def test_duplicate_key(self):
+        self.assertRaises(
+            yaml.constructor.ConstructorError,
+            yamlutils.safe_load,
+            'team: a\nteam: b\n',
+        )
+
+    def test_libyaml_used(self):
+        if not hasattr(yaml, 'CSafeLoader'):
+            self.skipTest('PyYAML was built without libyaml')
+        self.assertTrue(issubclass(yamlutils._SafeLoader, yaml.CSafeLoader))
+
+    def test_versions_and_hashes_are_strings(self):
+        # The validators expect every version and hash to be a string,
+        # including hashes that happen to look like a number.
+        data = yamlutils.safe_load(textwrap.dedent('''
+        version: 0.12.0
+        hash: 1234567890123456789012345678901234567e12
+        '''))
+        self.assertEqual(
+            {'version': '0.12.0',
+             'hash': '1234567890123456789012345678901234567e12'},
+            data,
+        )
@@ -12,6 +12,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
+
 import packaging.version
 import pbr.version
 
@@ -44,15 +46,22 @@ _VALIDATORS['python-pypi'] = _VALIDATORS['python-service']
 _VALIDATORS['generic'] = _VALIDATORS['python-service']
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_version(versionstr, release_type='python-service', pre_ok=True):
-    """Given a version string, yield error messages if it is "bad"
+    """Given a version string, return a tuple of error messages if it is "bad"
 
     Apply our SemVer rules to version strings and report all issues.
+    The same versions show up in many deliverables, so the results are
+    cached.
 
     """
+    return tuple(_version_errors(versionstr, release_type, pre_ok))
+
+
+def _version_errors(versionstr, release_type, pre_ok):
     if not pre_ok and looks_like_preversion(versionstr):
-        yield('Version %s looks like a pre-release and the release '
-              'model does not allow for it' % versionstr)
+        yield ('Version %s looks like a pre-release and the release '
+               'model does not allow for it' % versionstr)
 
     if release_type not in _VALIDATORS:
         yield 'Release Type %r not valid using \'python-service\' instead' % release_type
@@ -73,7 +82,7 @@ def validate_version(versionstr, release_type='python-service', pre_ok=True):
 
 def canonical_version(versionstr, release_type='python-service'):
     """Given a version string verify it is in the canonical form."""
-    errors = list(validate_version(versionstr, release_type))
+    errors = validate_version(versionstr, release_type)
     if errors:
         raise ValueError(errors[-1])
     return versionstr
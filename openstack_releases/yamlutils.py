@@ -14,6 +14,27 @@
 
 import ruamel.yaml
 import ruamel.yaml.compat
+import yaml
+
+# Use the libyaml parser when PyYAML was built with it.
+_BaseSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class _SafeLoader(_BaseSafeLoader):
+    "Safe loader that rejects duplicate keys, like ruamel.yaml."
+
+    def construct_mapping(self, node, deep=False):
+        seen = set()
+        for key_node, value_node in node.value:
+            if not isinstance(key_node, yaml.ScalarNode):
+                continue
+            if key_node.value in seen:
+                raise yaml.constructor.ConstructorError(
+                    'while constructing a mapping', node.start_mark,
+                    'found duplicate key %r' % key_node.value,
+                    key_node.start_mark)
+            seen.add(key_node.value)
+        return super().construct_mapping(node, deep=deep)
 
 
 def dumps(obj):
@@ -32,3 +53,13 @@ def loads(blob):
     """Load a yaml blob and retain key ordering."""
     yaml = ruamel.yaml.YAML()
     return yaml.load(blob)
+
+
+def safe_load(stream):
+    """Load yaml content from a string or an open file.
+
+    This is much faster than loads(), but does not retain the comments
+    and formatting, so use it for data that will not be written back.
+
+    """
+    return yaml.load(stream, Loader=_SafeLoader)